@@ -14,6 +14,7 @@ image = (
         "scikit-learn==1.3.0",
         "flask==2.3.3",
         "scipy==1.10.1",
+        "orjson==3.9.10",
         "requests==2.31.0",
         "beautifulsoup4==4.12.2",
         "pandas==2.0.3",
@@ -1,9 +1,13 @@
 import os
 import json
+import heapq
 import numpy as np
-import pandas as pd
-from collections import defaultdict
-from sklearn.metrics.pairwise import cosine_similarity
+
+from utils.json_utils import load_json
+from utils.lru_cache import LRUCache
+
+# Maximum number of hybrid recommendation results to keep
+HYBRID_CACHE_SIZE = 4096
 
 class CollaborativeFilter:
     def __init__(self, user_ratings_path=None):
@@ -12,35 +16,50 @@ class CollaborativeFilter:
         self.course_ratings = {}  # course -> {user_id: rating}
         self.user_similarity = {}  # user_id -> {other_user_id: similarity}
         self.course_similarity = {}  # course -> {other_course: similarity}
+        self.course_index = {}  # course -> position in score arrays
+        self.course_names = []  # position -> course
+        self._hybrid_cache = LRUCache(HYBRID_CACHE_SIZE)  # (user_id, top_n, user_weight) -> recommendations
         
         # Load user ratings if provided
         if user_ratings_path and os.path.exists(user_ratings_path):
             self.load_ratings(user_ratings_path)
-            self.compute_similarities()
     
     def load_ratings(self, ratings_path):
         """Load user ratings from a JSON file"""
-        with open(ratings_path, 'r') as f:
-            ratings_data = json.load(f)
+        ratings_data = load_json(ratings_path)
             
+        # Add everything first, then compute similarities in a single pass
         for user_id, ratings in ratings_data.items():
-            self.add_user_ratings(user_id, ratings)
+            self.add_user_ratings(user_id, ratings, update_similarities=False)
+        
+        self.compute_similarities()
     
-    def add_user_ratings(self, user_id, ratings):
+    def add_user_ratings(self, user_id, ratings, update_similarities=True):
         """Add ratings for a user
         
         Args:
             user_id (str): Unique identifier for the user
             ratings (dict): Dict of {course_name: rating} pairs
+            update_similarities (bool): Recompute the affected similarities now;
+                pass False when adding many users and call compute_similarities after
         """
         # Add to user_ratings dictionary
         self.user_ratings[user_id] = ratings
         
+        # Any cached hybrid results may depend on the old ratings
+        self._hybrid_cache.clear()
+        
         # Add to course_ratings dictionary
         for course, rating in ratings.items():
-            if course not in self.course_ratings:
-                self.course_ratings[course] = {}
-            self.course_ratings[course][user_id] = rating
+            course_raters = self.course_ratings.get(course)
+            if course_raters is None:
+                course_raters = self.course_ratings[course] = {}
+                self.course_index[course] = len(self.course_names)
+                self.course_names.append(course)
+            course_raters[user_id] = rating
+        
+        if not update_similarities:
+            return
         
         # Recompute similarities with the new data
         self._compute_user_similarity(user_id)
@@ -49,6 +68,8 @@ class CollaborativeFilter:
     
     def compute_similarities(self):
         """Compute all user and course similarities"""
+        self._hybrid_cache.clear()
+        
         # Compute user similarities
         for user_id in self.user_ratings:
             self._compute_user_similarity(user_id)
@@ -133,18 +154,18 @@ class CollaborativeFilter:
         
         Find similar users and recommend courses they rated highly
         """
-        if user_id not in self.user_ratings:
+        # Get the user's existing ratings
+        user_ratings = self.user_ratings.get(user_id)
+        if user_ratings is None:
             return []
             
-        # Get the user's existing ratings
-        user_courses = set(self.user_ratings[user_id].keys())
+        user_courses = set(user_ratings.keys())
         
-        # If user doesn't have similarities calculated yet
-        if user_id not in self.user_similarity:
+        # Get similar users, calculating them if not done yet
+        similar_users = self.user_similarity.get(user_id)
+        if similar_users is None:
             self._compute_user_similarity(user_id)
-        
-        # Get similar users
-        similar_users = self.user_similarity.get(user_id, {})
+            similar_users = self.user_similarity[user_id]
         
         if not similar_users:
             return []  # No similar users found
@@ -178,25 +199,23 @@ class CollaborativeFilter:
             if denominator > 0:
                 predicted_ratings[course] = numerator / denominator
         
-        # Sort by predicted rating
-        sorted_recommendations = sorted(predicted_ratings.items(), 
-                                       key=lambda x: x[1], 
-                                       reverse=True)
+        # Select the top N by predicted rating without a full sort
+        top_recommendations = heapq.nlargest(top_n, predicted_ratings.items(), 
+                                             key=lambda x: x[1])
         
         # Return top N recommendations
         return [{'course_name': course, 'predicted_rating': rating} 
-                for course, rating in sorted_recommendations[:top_n]]
+                for course, rating in top_recommendations]
     
     def item_based_recommendations(self, user_id, top_n=5):
         """Generate item-based collaborative filtering recommendations
         
         Find courses similar to those the user has rated highly
         """
-        if user_id not in self.user_ratings:
-            return []
-            
         # Get the user's existing ratings
-        user_ratings = self.user_ratings[user_id]
+        user_ratings = self.user_ratings.get(user_id)
+        if user_ratings is None:
+            return []
         
         # Calculate predicted ratings for unrated courses
         predicted_ratings = {}
@@ -207,7 +226,8 @@ class CollaborativeFilter:
                 continue
                 
             # Skip courses with no similarity data
-            if candidate_course not in self.course_similarity:
+            candidate_similarity = self.course_similarity.get(candidate_course)
+            if candidate_similarity is None:
                 continue
                 
             # Calculate weighted rating based on similar courses the user has rated
@@ -216,8 +236,8 @@ class CollaborativeFilter:
             
             for rated_course, rating in user_ratings.items():
                 # Check if we have similarity data for this pair
-                if rated_course in self.course_similarity.get(candidate_course, {}):
-                    similarity = self.course_similarity[candidate_course][rated_course]
+                similarity = candidate_similarity.get(rated_course)
+                if similarity is not None:
                     similarities.append(similarity)
                     ratings.append(rating)
             
@@ -230,59 +250,64 @@ class CollaborativeFilter:
                 if sum_similarities > 0:
                     predicted_ratings[candidate_course] = weighted_sum / sum_similarities
         
-        # Sort by predicted rating
-        sorted_recommendations = sorted(predicted_ratings.items(), 
-                                       key=lambda x: x[1], 
-                                       reverse=True)
+        # Select the top N by predicted rating without a full sort
+        top_recommendations = heapq.nlargest(top_n, predicted_ratings.items(), 
+                                             key=lambda x: x[1])
         
         # Return top N recommendations
         return [{'course_name': course, 'predicted_rating': rating} 
-                for course, rating in sorted_recommendations[:top_n]]
+                for course, rating in top_recommendations]
     
     def hybrid_recommendations(self, user_id, top_n=5, user_weight=0.5):
         """Generate hybrid recommendations combining user and item based approaches"""
+        # Reuse the result while no ratings have changed since it was computed
+        key = (user_id, top_n, user_weight)
+        cached = self._hybrid_cache.get(key)
+        if cached is not None:
+            return [dict(rec) for rec in cached]
+        
         # Get recommendations from both methods
         user_recs = self.user_based_recommendations(user_id, top_n=top_n*2)
         item_recs = self.item_based_recommendations(user_id, top_n=top_n*2)
         
-        # Convert to dictionaries for easier merging
-        user_dict = {rec['course_name']: rec['predicted_rating'] for rec in user_recs}
-        item_dict = {rec['course_name']: rec['predicted_rating'] for rec in item_recs}
-        
-        # Combine predictions
-        combined_ratings = {}
-        all_courses = set(user_dict.keys()) | set(item_dict.keys())
-        
-        for course in all_courses:
-            user_rating = user_dict.get(course, 0)
-            item_rating = item_dict.get(course, 0)
-            
-            # Weighted average of the two ratings
-            if course in user_dict and course in item_dict:
-                # Both methods gave a prediction
-                combined_ratings[course] = (user_weight * user_rating + 
-                                           (1 - user_weight) * item_rating)
-            elif course in user_dict:
-                # Only user-based gave a prediction
-                combined_ratings[course] = user_rating
-            else:
-                # Only item-based gave a prediction
-                combined_ratings[course] = item_rating
-        
-        # Sort by combined rating
-        sorted_recommendations = sorted(combined_ratings.items(), 
-                                       key=lambda x: x[1], 
-                                       reverse=True)
+        # Scatter both predictions into arrays indexed by course position
+        num_courses = len(self.course_names)
+        user_scores = np.zeros(num_courses)
+        item_scores = np.zeros(num_courses)
+        has_user = np.zeros(num_courses, dtype=bool)
+        has_item = np.zeros(num_courses, dtype=bool)
+        
+        user_ids = np.array([self.course_index[rec['course_name']] for rec in user_recs], dtype=np.intp)
+        item_ids = np.array([self.course_index[rec['course_name']] for rec in item_recs], dtype=np.intp)
+        user_scores[user_ids] = [rec['predicted_rating'] for rec in user_recs]
+        item_scores[item_ids] = [rec['predicted_rating'] for rec in item_recs]
+        has_user[user_ids] = True
+        has_item[item_ids] = True
+        
+        # Weighted average where both methods gave a prediction, otherwise
+        # whichever one did (the missing score is zero)
+        combined_ratings = np.where(has_user & has_item,
+                                    user_weight * user_scores + (1 - user_weight) * item_scores,
+                                    user_scores + item_scores)
+        
+        # Select the top N by combined rating without a full sort
+        candidates = np.flatnonzero(has_user | has_item)
+        if top_n < len(candidates):
+            candidates = candidates[np.argpartition(-combined_ratings[candidates], top_n - 1)[:top_n]]
+        top_recommendations = candidates[np.argsort(-combined_ratings[candidates], kind='stable')]
+        
+        recommendations = [{'course_name': self.course_names[i], 'predicted_rating': float(combined_ratings[i])} 
+                           for i in top_recommendations]
+        
+        self._hybrid_cache.put(key, recommendations)
         
         # Return top N recommendations
-        return [{'course_name': course, 'predicted_rating': rating} 
-                for course, rating in sorted_recommendations[:top_n]]
+        return [dict(rec) for rec in recommendations]
                 
     def create_default_ratings(self, course_skills_path, output_path):
         """Create a default ratings file from course data for testing"""
         # Load course data
-        with open(course_skills_path, 'r') as f:
-            course_data = json.load(f)
+        course_data = load_json(course_skills_path)
             
         # Generate synthetic users and ratings
         num_users = 50  # Number of synthetic users
@@ -322,12 +347,12 @@ class CollaborativeFilter:
         """Get the most popular courses based on number of ratings"""
         course_popularity = {course: len(ratings) for course, ratings in self.course_ratings.items()}
         
-        # Sort by number of ratings
-        sorted_courses = sorted(course_popularity.items(), key=lambda x: x[1], reverse=True)
+        # Select the most rated courses
+        sorted_courses = heapq.nlargest(top_n, course_popularity.items(), key=lambda x: x[1])
         
         # Return top N courses
         return [{'course_name': course, 'num_ratings': count} 
-                for course, count in sorted_courses[:top_n]]
+                for course, count in sorted_courses]
                 
     def get_top_rated_courses(self, min_ratings=3, top_n=10):
         """Get the top rated courses with a minimum number of ratings"""
@@ -339,12 +364,12 @@ class CollaborativeFilter:
                 avg_rating = sum(ratings.values()) / len(ratings)
                 avg_ratings[course] = avg_rating
         
-        # Sort by average rating
-        sorted_courses = sorted(avg_ratings.items(), key=lambda x: x[1], reverse=True)
+        # Select the highest average ratings
+        sorted_courses = heapq.nlargest(top_n, avg_ratings.items(), key=lambda x: x[1])
         
         # Return top N courses
         return [{'course_name': course, 'avg_rating': rating} 
-                for course, rating in sorted_courses[:top_n]]
+                for course, rating in sorted_courses]
 
 # Example usage
 if __name__ == "__main__":
@@ -1,22 +1,46 @@
-import json
 import os
 import sys
+import glob
+import heapq
+import functools
+import hashlib
+import pickle
 import networkx as nx
+import numpy as np
+from scipy import sparse
 from collections import defaultdict
 
-# Add project root to Python path
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from models.recommendation_model import build_skill_vocabulary, top_n_indices
+from utils.json_utils import load_json
+from utils.lru_cache import LRUCache
+from utils.skill_graph import SkillGraph, PROFICIENCY_LEVELS, PROFICIENCY_NAMES
 
-from utils.skill_graph import SkillGraph
+# Maximum number of user skill profiles to keep course match scores for
+MATCH_CACHE_SIZE = 256
+
+# Maximum number of (career goal, top_n) pairs to keep aligned courses for
+CAREER_CACHE_SIZE = 128
+
+# Directory, next to the course data, that holds cached course dependency graphs
+COURSE_GRAPH_CACHE_DIR = 'cache'
 
 class LearningPathGenerator:
-    def __init__(self, course_skills_path, skill_graph=None):
+    def __init__(self, course_skills_path, skill_graph=None, course_data=None):
         """Initialize learning path generator with course data and skill graph"""
-        # Load course data
-        with open(course_skills_path, 'r') as f:
-            self.course_data = json.load(f)
+        # Load course data unless the caller already has it parsed
+        loaded_from_disk = course_data is None
+        if loaded_from_disk:
+            course_data = load_json(course_skills_path)
+        
+        # Intern skill names so the many set/dict lookups below compare by identity,
+        # in per-course copies so a caller's course_data is left unchanged
+        self.course_data = {
+            course_name: dict(course_info, required_skills=[sys.intern(skill) for skill in course_info['required_skills']])
+            for course_name, course_info in course_data.items()
+        }
             
         # Initialize or load skill graph
+        graph_path = None
         if skill_graph:
             self.skill_graph = skill_graph
         else:
@@ -26,11 +50,142 @@ class LearningPathGenerator:
                 self.skill_graph = SkillGraph()
                 self.skill_graph.load_graph(graph_path)
             else:
-                self.skill_graph = SkillGraph(course_skills_path)
+                graph_path = None
+                self.skill_graph = SkillGraph(course_skills_path, course_data=self.course_data)
                 self.skill_graph.initialize_common_relationships()
                 
-        # Create course dependency graph
-        self.course_graph = self._build_course_dependency_graph()
+        # Index which courses require each skill for vectorized scoring
+        self._build_course_skill_index()
+        
+        # Create course dependency graph, reusing the on-disk copy when both
+        # input files are unchanged (only possible when they were read from disk)
+        cache_path = None
+        if loaded_from_disk and graph_path:
+            cache_path = self._course_graph_cache_path(course_skills_path, graph_path)
+        self.course_graph = self._load_cached_course_graph(cache_path)
+        if self.course_graph is None:
+            self.course_graph = self._build_course_dependency_graph()
+            self._save_cached_course_graph(cache_path)
+        
+        # Flat adjacency arrays for the per-step traversals and edge lookups
+        self._build_course_adjacency()
+        
+        # Career-aligned courses keyed by (career_goal, top_n)
+        self._career_cache = LRUCache(CAREER_CACHE_SIZE)
+        
+        # Course match scores keyed by the user's (skill, proficiency) pairs
+        self._match_cache = LRUCache(MATCH_CACHE_SIZE)
+        
+    def _build_course_skill_index(self):
+        """Build an inverted skill -> course positions index over the course catalog"""
+        self.course_names = list(self.course_data)
+        self.course_index = {course_name: i for i, course_name in enumerate(self.course_names)}
+        
+        # Sparse course x skill matrix (CSR) for scoring every course with one product
+        self.skill_vocab = build_skill_vocabulary(self.course_data)
+        skill_courses = defaultdict(list)
+        indptr = [0]
+        indices = []
+        for i, course_info in enumerate(self.course_data.values()):
+            # Each skill counts once per course, as with set-based overlap
+            for skill in dict.fromkeys(course_info['required_skills']):
+                skill_courses[skill].append(i)
+                indices.append(self.skill_vocab[skill])
+            indptr.append(len(indices))
+        
+        self.skill_courses = {skill: np.array(courses, dtype=np.int32)
+                              for skill, courses in skill_courses.items()}
+        
+        self.course_matrix = sparse.csr_matrix((np.ones(len(indices), dtype=np.float32), indices, indptr),
+                                               shape=(len(self.course_names), len(self.skill_vocab)))
+        self.course_skill_counts = np.diff(indptr).astype(np.float64)
+        
+        # Each course's required skills as a set, built once
+        self.course_skill_sets = {course_name: frozenset(course_info['required_skills'])
+                                  for course_name, course_info in self.course_data.items()}
+        
+        # Courses with the fewest required skills, as starting points for users without skills
+        self._easiest_starts = sorted(self.course_names, key=lambda c: len(self.course_skill_sets[c]))[:3]
+    
+    def _build_course_adjacency(self):
+        """Flatten the course graph into CSR arrays indexed by course position"""
+        indptr = [0]
+        indices = []
+        self._edge_ids = {}  # (course1 position, course2 position) -> edge id
+        self._edge_weights = {}  # (course1 name, course2 name) -> dependency weight
+        self._edge_dependency_skills = []
+        
+        for i, course_name in enumerate(self.course_names):
+            for successor, edge_data in self.course_graph.adj[course_name].items():
+                j = self.course_index[successor]
+                self._edge_ids[(i, j)] = len(indices)
+                indices.append(j)
+                self._edge_weights[(course_name, successor)] = edge_data.get('weight', 0)
+                self._edge_dependency_skills.append(edge_data.get('dependency_skills', frozenset()))
+            indptr.append(len(indices))
+        
+        self._indptr = np.array(indptr, dtype=np.int32)
+        self._indices = np.array(indices, dtype=np.int32)
+    
+    def _successors(self, course_idx):
+        """Positions of the courses that the given course leads to"""
+        return self._indices[self._indptr[course_idx]:self._indptr[course_idx + 1]].tolist()
+    
+    def _count_skill_matches(self, skills):
+        """Count, for every course, how many of the given set of skills it requires"""
+        # Only the courses listed under the given skills are touched
+        course_ids = [self.skill_courses[skill] for skill in skills if skill in self.skill_courses]
+        if not course_ids:
+            return np.zeros(len(self.course_names), dtype=np.intp)
+        
+        return np.bincount(np.concatenate(course_ids), minlength=len(self.course_names))
+        
+    def _course_graph_cache_path(self, course_skills_path, graph_path):
+        """Name the course graph cache file after the course data file and the path, mtime and size of its inputs"""
+        digest = hashlib.sha1()
+        for path in (course_skills_path, graph_path):
+            stat = os.stat(path)
+            digest.update(f'{os.path.abspath(path)}:{stat.st_mtime_ns}:{stat.st_size};'.encode())
+        
+        name = os.path.splitext(os.path.basename(course_skills_path))[0]
+        return os.path.join(os.path.dirname(course_skills_path), COURSE_GRAPH_CACHE_DIR,
+                            f'course_graph.{name}.{digest.hexdigest()}.pkl')
+    
+    def _load_cached_course_graph(self, cache_path):
+        """Load a previously built course graph, or return None if there is none"""
+        if not cache_path or not os.path.exists(cache_path):
+            return None
+        
+        try:
+            with open(cache_path, 'rb') as f:
+                return pickle.load(f)
+        except Exception as e:
+            print(f"Error loading cached course graph: {str(e)}")
+            return None
+    
+    def _save_cached_course_graph(self, cache_path):
+        """Save the course graph so later runs can skip rebuilding it"""
+        if not cache_path:
+            return
+        
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            with open(cache_path, 'wb') as f:
+                pickle.dump(self.course_graph, f)
+        except Exception as e:
+            print(f"Error saving cached course graph: {str(e)}")
+            return
+        
+        # Graphs cached for earlier versions of the same course data file are stale
+        # now; those of other course data files in the same directory are kept
+        family = os.path.basename(cache_path).rsplit('.', 2)[0]
+        pattern = glob.escape(family) + '.' + '[0-9a-f]' * 40 + '.pkl'
+        for stale_path in glob.glob(os.path.join(glob.escape(os.path.dirname(cache_path)), pattern)):
+            if os.path.abspath(stale_path) != os.path.abspath(cache_path):
+                try:
+                    os.remove(stale_path)
+                except OSError as e:
+                    print(f"Error removing stale course graph {stale_path}: {str(e)}")
         
     def _build_course_dependency_graph(self):
         """Build a graph of course dependencies based on skill relationships"""
@@ -40,26 +195,42 @@ class LearningPathGenerator:
         for course_name in self.course_data:
             course_graph.add_node(course_name)
         
-        # Analyze skill dependencies to determine course dependencies
-        for course1, info1 in self.course_data.items():
-            for course2, info2 in self.course_data.items():
-                if course1 != course2:
-                    # Check if course1 provides prerequisites for course2
-                    prerequisite_score = 0
-                    dependency_skills = []
-                    
-                    for skill in info2['required_skills']:
-                        prerequisites = self.skill_graph.get_prerequisites(skill)
-                        for prereq in prerequisites:
-                            if prereq in info1['required_skills']:
-                                prerequisite_score += 1
-                                dependency_skills.append(prereq)
-                    
-                    # Add an edge if there's significant skill dependency
-                    if prerequisite_score >= 2:  # Threshold for significant dependency
-                        course_graph.add_edge(course1, course2, 
-                                              weight=prerequisite_score,
-                                              dependency_skills=list(set(dependency_skills)))
+        # Look up each skill's prerequisites once
+        prereq_map = {skill: self.skill_graph.get_prerequisites(skill) for skill in self.skill_courses}
+        
+        # Count prerequisite links between every pair of courses with two sparse
+        # products over skill ids: (course2 skills) x (skill -> prerequisite) x (course1 skills)
+        n_skills = len(self.skill_vocab)
+        course_rows, course_cols = [], []
+        for course2_idx, info2 in enumerate(self.course_data.values()):
+            for skill in info2['required_skills']:
+                course_rows.append(course2_idx)
+                course_cols.append(self.skill_vocab[skill])
+        skill_counts = sparse.csr_matrix((np.ones(len(course_rows)), (course_rows, course_cols)),
+                                         shape=(len(self.course_names), n_skills))
+        
+        prereq_rows, prereq_cols = [], []
+        for skill, prereqs in prereq_map.items():
+            for prereq in prereqs:
+                if prereq in self.skill_vocab:
+                    prereq_rows.append(self.skill_vocab[skill])
+                    prereq_cols.append(self.skill_vocab[prereq])
+        prereq_counts = sparse.csr_matrix((np.ones(len(prereq_rows)), (prereq_rows, prereq_cols)),
+                                          shape=(n_skills, n_skills))
+        
+        # dependency_counts[course1, course2] = number of course2 skill prerequisites taught by course1
+        dependency_counts = (skill_counts @ prereq_counts @ self.course_matrix.T).T.toarray()
+        np.fill_diagonal(dependency_counts, 0)
+        
+        # Add edges in catalog order where course1 provides significant prerequisites for course2
+        course_infos = list(self.course_data.values())
+        for course1_idx, course2_idx in zip(*np.nonzero(dependency_counts >= 2)):  # Threshold for significant dependency
+            course1_skills = self.course_skill_sets[self.course_names[course1_idx]]
+            dependency_skills = frozenset(prereq for skill in course_infos[course2_idx]['required_skills']
+                                          for prereq in prereq_map[skill] if prereq in course1_skills)
+            course_graph.add_edge(self.course_names[course1_idx], self.course_names[course2_idx], 
+                                  weight=int(dependency_counts[course1_idx, course2_idx]),
+                                  dependency_skills=dependency_skills)
         
         return course_graph
         
@@ -75,29 +246,33 @@ class LearningPathGenerator:
         Returns:
             List of courses forming a learning path
         """
-        # Step 1: Find courses that match user's existing skills
-        course_matches = self._match_courses_to_skills(user_skills)
-        
-        # Step 2: Determine starting point(s) based on best matches
-        starting_courses = [course for course, score in 
-                           sorted(course_matches.items(), key=lambda x: x[1], reverse=True)[:3]]
+        # Step 1 & 2: Find courses that match user's existing skills and start
+        # from the best matches (or from the easiest courses if there are no skills)
+        if user_skills:
+            course_matches = self._match_courses_to_skills(user_skills)
+            starting_courses = [course for course, score in 
+                               heapq.nlargest(3, course_matches.items(), key=lambda x: x[1])]
+        else:
+            starting_courses = self._easiest_starts
         
         # Step 3: Generate paths from starting points
+        user_skill_set = frozenset(user_skills)
         paths = []
         for start_course in starting_courses:
             # Use shortest path algorithms if a career goal is specified
             if career_goal and career_goal in self.course_data:
                 try:
-                    path = nx.shortest_path(self.course_graph, start_course, career_goal)
+                    # Unweighted search from both ends; weights only matter for scoring
+                    path = nx.bidirectional_shortest_path(self.course_graph, start_course, career_goal)
                     paths.append((path, self._calculate_path_score(path, user_skills)))
                 except (nx.NetworkXNoPath, nx.NodeNotFound):
                     # If no direct path, find a path that gets closest to the goal
-                    partial_path = self._find_best_partial_path(start_course, career_goal, user_skills)
+                    partial_path = self._find_best_partial_path(start_course, career_goal, user_skills, user_skill_set)
                     if partial_path:
                         paths.append((partial_path, self._calculate_path_score(partial_path, user_skills)))
             else:
                 # Without a specific goal, find paths that build on each other
-                path = self._find_progressive_path(start_course, user_skills, path_length)
+                path = self._find_progressive_path(start_course, user_skill_set, path_length)
                 paths.append((path, self._calculate_path_score(path, user_skills)))
         
         # Step 4: Choose the best path
@@ -111,32 +286,46 @@ class LearningPathGenerator:
     
     def _match_courses_to_skills(self, user_skills):
         """Calculate how well each course matches user's existing skills"""
-        course_scores = {}
-        user_skill_set = set(user_skills.keys())
-        
-        for course_name, course_info in self.course_data.items():
-            course_skills = set(course_info['required_skills'])
-            
-            # Calculate overlap between user skills and course required skills
-            overlap = user_skill_set.intersection(course_skills)
-            
-            # Calculate match score based on overlap and proficiency
-            score = 0
-            for skill in overlap:
-                proficiency = user_skills.get(skill, "Beginner")
-                weight = self.skill_graph._convert_proficiency_to_weight(proficiency)
-                score += weight
-                
-            # Normalize score by total required skills
-            if course_skills:
-                normalized_score = score / len(course_skills)
-                course_scores[course_name] = normalized_score
-            else:
-                course_scores[course_name] = 0
+        if not user_skills:
+            return dict.fromkeys(self.course_names, 0.0)
+        
+        # Path scoring asks for the same user's scores many times per request
+        key = frozenset(user_skills.items())
+        course_scores = self._match_cache.get(key)
+        if course_scores is not None:
+            return course_scores
+        
+        # Weight each of the user's skills by proficiency, gathering skill ids and
+        # weights as parallel lists and scattering them into the vector at once
+        to_weight = self.skill_graph._convert_proficiency_to_weight
+        known_skills = [(self.skill_vocab[skill], to_weight(proficiency))
+                        for skill, proficiency in user_skills.items() if skill in self.skill_vocab]
+        user_weights = np.zeros(len(self.skill_vocab), dtype=np.float32)
+        if known_skills:
+            skill_ids, weights = zip(*known_skills)
+            user_weights[np.array(skill_ids, dtype=np.int32)] = weights
+        
+        # Sum the weights of each course's matched skills and normalize by
+        # its total required skills, for all courses at once (the sums of
+        # quarter weights are exact in float32; the division is done in float64)
+        scores = (self.course_matrix @ user_weights).astype(np.float64) / np.maximum(self.course_skill_counts, 1)
+        course_scores = dict(zip(self.course_names, scores.tolist()))
+        
+        self._match_cache.put(key, course_scores)
         
         return course_scores
     
-    def _find_progressive_path(self, start_course, user_skills, path_length=5):
+    def _score_course(self, course, user_skills):
+        """Match score of a single course, as computed for all courses by _match_courses_to_skills"""
+        required_skills = self.course_skill_sets[course]
+        if not required_skills or not user_skills:
+            return 0.0
+        
+        weight = self.skill_graph._convert_proficiency_to_weight
+        matched_weight = sum(weight(user_skills[skill]) for skill in required_skills.intersection(user_skills))
+        return matched_weight / len(required_skills)
+    
+    def _find_progressive_path(self, start_course, user_skill_set, path_length=5):
         """Find a progressive learning path that builds on user's current skills"""
         path = [start_course]
         current = start_course
@@ -144,13 +333,17 @@ class LearningPathGenerator:
         # Keep track of visited courses to avoid cycles
         visited = {start_course}
         
+        # Skills taught by the courses already on the path
+        previous_skills = set(self.course_skill_sets[start_course])
+        
         while len(path) < path_length:
             # Get all possible next courses
             next_courses = []
-            for successor in self.course_graph.successors(current):
+            for successor_idx in self._successors(self.course_index[current]):
+                successor = self.course_names[successor_idx]
                 if successor not in visited:
                     # Calculate how well the user can take this course
-                    readiness_score = self._calculate_course_readiness(successor, user_skills, path)
+                    readiness_score = self._calculate_course_readiness(successor, user_skill_set, previous_skills)
                     next_courses.append((successor, readiness_score))
             
             # Sort by readiness score and pick the best
@@ -164,83 +357,54 @@ class LearningPathGenerator:
             best_next = next_courses[0][0]
             path.append(best_next)
             visited.add(best_next)
+            previous_skills |= self.course_skill_sets[best_next]
             current = best_next
-            
-            # Update virtual user skills - assume they learn the skills from the course
-            virtual_user_skills = user_skills.copy()
-            for skill in self.course_data[best_next]['required_skills']:
-                if skill not in virtual_user_skills:
-                    virtual_user_skills[skill] = "Beginner"
-                else:
-                    # Upgrade skill level if not already at expert
-                    current_level = virtual_user_skills[skill].lower()
-                    if current_level == "beginner":
-                        virtual_user_skills[skill] = "Intermediate"
-                    elif current_level == "intermediate":
-                        virtual_user_skills[skill] = "Advanced"
-                    elif current_level == "advanced":
-                        virtual_user_skills[skill] = "Expert"
         
         return path
     
-    def _find_best_partial_path(self, start_course, goal_course, user_skills):
+    def _find_best_partial_path(self, start_course, goal_course, user_skills, user_skill_set):
         """Find a path that gets closest to the goal when a direct path doesn't exist"""
-        # Calculate the course sequence leading to the goal
-        backwards_paths = nx.bfs_tree(self.course_graph.reverse(), goal_course)
-        
-        # Find courses reachable from the start that intersect with the goal tree
-        forwards_paths = nx.bfs_tree(self.course_graph, start_course)
+        # Shortest paths from the start to every course it reaches, and from
+        # every course that leads to the goal, each found in a single BFS
+        paths_from_start = nx.single_source_shortest_path(self.course_graph, start_course)
+        paths_to_goal = nx.single_source_shortest_path(self.course_graph.reverse(copy=False), goal_course)
         
         # Find common nodes (intersection points)
-        intersection_nodes = set(backwards_paths.nodes()).intersection(set(forwards_paths.nodes()))
+        intersection_nodes = [course for course in paths_from_start if course in paths_to_goal]
         
         if not intersection_nodes:
             # No path connection, return a default progressive path
-            return self._find_progressive_path(start_course, user_skills)
+            return self._find_progressive_path(start_course, user_skill_set)
         
         # Find the best intersection point based on path quality
-        best_bridge = None
+        best_path = None
         best_score = -1
         
         for bridge in intersection_nodes:
-            # Get path from start to bridge
-            path_to_bridge = nx.shortest_path(self.course_graph, start_course, bridge)
-            # Get path from bridge to goal
-            path_from_bridge = nx.shortest_path(self.course_graph, bridge, goal_course)
-            
-            # Combine paths (exclude duplicate bridge node)
-            full_path = path_to_bridge + path_from_bridge[1:]
+            # Combine start -> bridge and bridge -> goal (exclude duplicate bridge node)
+            full_path = paths_from_start[bridge] + paths_to_goal[bridge][-2::-1]
             
             # Score the path
             score = self._calculate_path_score(full_path, user_skills)
             
             if score > best_score:
                 best_score = score
-                best_bridge = bridge
+                best_path = full_path
         
-        if best_bridge:
-            # Construct the best path
-            path_to_bridge = nx.shortest_path(self.course_graph, start_course, best_bridge)
-            path_from_bridge = nx.shortest_path(self.course_graph, best_bridge, goal_course)
-            full_path = path_to_bridge + path_from_bridge[1:]
-            return full_path
+        if best_path:
+            return best_path
         
         # Fallback
-        return self._find_progressive_path(start_course, user_skills)
+        return self._find_progressive_path(start_course, user_skill_set)
     
-    def _calculate_course_readiness(self, course, user_skills, previous_courses):
-        """Calculate how ready a user is to take a course based on skills and previous courses"""
-        required_skills = set(self.course_data[course]['required_skills'])
-        user_skill_set = set(user_skills.keys())
+    def _calculate_course_readiness(self, course, user_skill_set, previous_skills):
+        """Calculate how ready a user is to take a course based on skills and the skills of previous courses"""
+        required_skills = self.course_skill_sets[course]
         
         # Calculate direct skill match
         direct_match = len(required_skills.intersection(user_skill_set)) / len(required_skills) if required_skills else 0
         
         # Calculate skill preparation from previous courses
-        previous_skills = set()
-        for prev_course in previous_courses:
-            previous_skills.update(self.course_data[prev_course]['required_skills'])
-        
         skill_preparation = len(required_skills.intersection(previous_skills)) / len(required_skills) if required_skills else 0
         
         # Calculate weighted readiness score
@@ -253,22 +417,13 @@ class LearningPathGenerator:
         if not path:
             return 0
             
-        # Initialize score
-        score = 0
-        
-        # Calculate progression quality
-        for i in range(len(path) - 1):
-            current = path[i]
-            next_course = path[i + 1]
-            
-            # Check if there's a strong dependency
-            if self.course_graph.has_edge(current, next_course):
-                # Higher weight means stronger dependency
-                edge_weight = self.course_graph[current][next_course].get('weight', 0)
-                score += edge_weight
+        # Calculate progression quality: consecutive courses joined by a
+        # dependency edge add its weight (higher means stronger dependency)
+        edge_weights = self._edge_weights
+        score = sum(edge_weights.get(step, 0) for step in zip(path, path[1:]))
         
         # Adjust score based on starting point match quality
-        start_match = self._match_courses_to_skills(user_skills).get(path[0], 0)
+        start_match = self._score_course(path[0], user_skills)
         score *= (0.5 + start_match)
         
         # Normalize score by path length
@@ -280,8 +435,12 @@ class LearningPathGenerator:
         """Format learning path with details about each course"""
         formatted_path = []
         
-        # For tracking virtual skill acquisition through the path
+        # For tracking virtual skill acquisition through the path, as display
+        # labels plus integer levels (None for labels that are not a known level)
         virtual_skills = user_skills.copy()
+        virtual_levels = {skill: PROFICIENCY_LEVELS.get(proficiency.lower())
+                          for skill, proficiency in user_skills.items()}
+        expert_level = len(PROFICIENCY_NAMES) - 1
         
         for i, course_name in enumerate(path):
             course_info = self.course_data[course_name]
@@ -304,10 +463,11 @@ class LearningPathGenerator:
             next_steps_rationale = ""
             if i < len(path) - 1:
                 next_course = path[i + 1]
-                if self.course_graph.has_edge(course_name, next_course):
-                    dependency_skills = self.course_graph[course_name][next_course].get('dependency_skills', [])
+                edge_id = self._edge_ids.get((self.course_index[course_name], self.course_index[next_course]))
+                if edge_id is not None:
+                    dependency_skills = self._edge_dependency_skills[edge_id]
                     if dependency_skills:
-                        skill_list = ", ".join(dependency_skills[:3])
+                        skill_list = ", ".join(list(dependency_skills)[:3])
                         if len(dependency_skills) > 3:
                             skill_list += f", and {len(dependency_skills) - 3} more"
                         next_steps_rationale = f"This course helps prepare you for {next_course} by teaching {skill_list}."
@@ -324,46 +484,55 @@ class LearningPathGenerator:
             
             # Update virtual skills with new skills learned from this course
             for skill in required_skills:
-                if skill not in virtual_skills:
-                    virtual_skills[skill] = "Beginner"
-                else:
-                    # Upgrade skill level if not already at expert
-                    current_level = virtual_skills[skill].lower()
-                    if current_level == "beginner":
-                        virtual_skills[skill] = "Intermediate"
-                    elif current_level == "intermediate":
-                        virtual_skills[skill] = "Advanced"
-                    elif current_level == "advanced":
-                        virtual_skills[skill] = "Expert"
+                # New skills start at beginner; known ones move up a level until expert
+                level = virtual_levels.get(skill, -1)
+                if level is not None and level < expert_level:
+                    virtual_levels[skill] = level + 1
+                    virtual_skills[skill] = PROFICIENCY_NAMES[level + 1]
         
         return formatted_path
     
     def get_career_aligned_courses(self, career_goal, top_n=5):
         """Get courses most aligned with a specific career goal"""
+        # Unknown goals are free text, so they are answered without being cached
         if career_goal not in self.course_data:
             return []
-            
+        
+        # The catalog does not change after init, so results can be reused
+        key = (career_goal, top_n)
+        aligned_courses = self._career_cache.get(key)
+        if aligned_courses is None:
+            aligned_courses = self._compute_career_aligned_courses(career_goal, top_n)
+            self._career_cache.put(key, aligned_courses)
+        
+        return list(aligned_courses)
+    
+    def _compute_career_aligned_courses(self, career_goal, top_n):
+        """Score courses by how many of the career goal's skills they cover"""
         # Get skills required for the career goal
-        goal_skills = set(self.course_data[career_goal]['required_skills'])
+        goal_skills = self.course_skill_sets[career_goal]
         
-        # Score each course based on skill overlap with career goal
-        course_scores = {}
-        for course_name, course_info in self.course_data.items():
-            if course_name == career_goal:
-                continue  # Skip the goal itself
-                
-            course_skills = set(course_info['required_skills'])
-            overlap = goal_skills.intersection(course_skills)
-            
-            if overlap:
-                # Score based on percentage of goal skills covered
-                score = len(overlap) / len(goal_skills) if goal_skills else 0
-                course_scores[course_name] = score
+        # Score each course based on the percentage of goal skills it covers
+        overlap_counts = self._count_skill_matches(goal_skills)
+        overlap_counts[self.course_index[career_goal]] = 0  # Skip the goal itself
+        
+        candidates = np.flatnonzero(overlap_counts)
+        scores = overlap_counts[candidates] / len(goal_skills)
         
         # Return top courses
-        return sorted(course_scores.items(), key=lambda x: x[1], reverse=True)[:top_n]
+        order = top_n_indices(scores, top_n)
+        return [(self.course_names[candidates[i]], float(scores[i])) for i in order]
+
+@functools.lru_cache(maxsize=4)
+def get_learning_path_generator(course_skills_path):
+    """
+    Return a LearningPathGenerator for the course data file, built once per process.
+    
+    The instance is shared between callers and must not be modified.
+    """
+    return LearningPathGenerator(course_skills_path)
 
-# Example usage
+# Example usage (run from the project root: python -m models.learning_path)
 if __name__ == "__main__":
     base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     data_path = os.path.join(base_dir, 'data', 'course_skills.json')
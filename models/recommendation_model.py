@@ -1,17 +1,66 @@
-import json
 import os
 import numpy as np
 from collections import defaultdict
 
+from utils.json_utils import load_json
+from utils.lru_cache import LRUCache
+
+# Maximum number of (skill profile, top_n) results to keep per model
+RECOMMENDATION_CACHE_SIZE = 4096
+
+# Number of set bits in every possible byte value
+_POPCOUNT_TABLE = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+
+def build_skill_vocabulary(course_data):
+    """Map every skill in the course catalog to an integer id, in sorted name order."""
+    all_skills = set()
+    for course_info in course_data.values():
+        all_skills.update(course_info.get('required_skills', []))
+    
+    return {skill: i for i, skill in enumerate(sorted(all_skills))}
+
+def build_course_skill_matrix(course_data, skill_vocab):
+    """Build a boolean (course x skill) matrix marking each course's required skills."""
+    skill_matrix = np.zeros((len(course_data), len(skill_vocab)), dtype=bool)
+    for i, course_info in enumerate(course_data.values()):
+        skill_matrix[i, [skill_vocab[skill] for skill in course_info.get('required_skills', [])]] = True
+    
+    return skill_matrix
+
+def top_n_indices(scores, top_n):
+    """Return indices of the top_n highest scores, highest first, with ties kept in index order."""
+    if top_n is None or top_n >= len(scores):
+        return np.argsort(-scores, kind='stable')
+    if top_n <= 0:
+        return np.array([], dtype=np.intp)
+        
+    # Partition around the top_n-th highest score and only sort the scores
+    # at or above it, so ties at the cutoff resolve as in a full stable sort
+    cutoff = -np.partition(-scores, top_n - 1)[top_n - 1]
+    candidates = np.flatnonzero(scores >= cutoff)
+    return candidates[np.argsort(-scores[candidates], kind='stable')][:top_n]
+
+def format_user_skill(skill, proficiency):
+    """Format a user skill as "Skill (Proficiency)", noting certified skills."""
+    if isinstance(proficiency, dict):
+        prof_value = proficiency.get("proficiency", "Intermediate")
+        is_certified = proficiency.get("isBackedByCertificate", False)
+        cert_text = " (certified)" if is_certified else ""
+        return f"{skill} ({prof_value}{cert_text})"
+    
+    return f"{skill} ({proficiency})"
+
 class CourseRecommendationModel:
     """
     Simplified version of the recommendation model that only provides basic functionality
     needed for the faculty development system.
     """
-    def __init__(self, course_skills_path):
-        # Load course skills data
-        with open(course_skills_path, 'r') as f:
-            self.course_data = json.load(f)
+    def __init__(self, course_skills_path, course_data=None):
+        # Load course skills data unless the caller already has it parsed
+        if course_data is not None:
+            self.course_data = course_data
+        else:
+            self.course_data = load_json(course_skills_path)
         
         # Extract all unique skills across all courses
         self.all_skills = set()
@@ -20,6 +69,23 @@ class CourseRecommendationModel:
                 self.all_skills.add(skill)
         
         self.all_skills = sorted(list(self.all_skills))
+        
+        # Precompute each course's skill set and a bit-packed course x skill matrix,
+        # over the same skill ids as the other components
+        self._skill_id = build_skill_vocabulary(self.course_data)
+        self._course_names = list(self.course_data)
+        self._course_index = {course_name: i for i, course_name in enumerate(self._course_names)}
+        self._course_skill_sets = {course_name: frozenset(course_info.get('required_skills', []))
+                                   for course_name, course_info in self.course_data.items()}
+        
+        skill_matrix = build_course_skill_matrix(self.course_data, self._skill_id)
+        self._skill_bitmatrix = np.packbits(skill_matrix, axis=1)
+        self._course_skill_counts = skill_matrix.sum(axis=1)
+        # Positions of the courses that can be recommended (those with skills)
+        self._courses_with_skills = np.flatnonzero(self._course_skill_counts)
+        
+        # Recommendations keyed by (top_n, canonical skill profile)
+        self._recommendation_cache = LRUCache(RECOMMENDATION_CACHE_SIZE)
     
     def recommend_courses(self, user_skills, top_n=5):
         """
@@ -33,38 +99,52 @@ class CourseRecommendationModel:
         Returns:
             List of course recommendations with match details
         """
-        recommendations = []
+        # Only the skill names, proficiency labels and certificates affect the result
+        profile = frozenset(
+            (skill, proficiency.get("proficiency", "Intermediate"), bool(proficiency.get("isBackedByCertificate", False)))
+            if isinstance(proficiency, dict) else (skill, proficiency)
+            for skill, proficiency in user_skills.items()
+        )
+        key = (top_n, profile)
+        recommendations = self._recommendation_cache.get(key)
+        if recommendations is None:
+            recommendations = self._recommend_courses(user_skills, top_n)
+            self._recommendation_cache.put(key, recommendations)
         
-        # Calculate match percentage for each course
-        for course_name, course_info in self.course_data.items():
-            required_skills = set(course_info.get('required_skills', []))
-            
-            if not required_skills:
-                continue
-                
-            user_skill_names = set(user_skills.keys())
-            
+        # Hand out copies so callers cannot modify the cached results
+        return [{field: list(value) if isinstance(value, list) else value for field, value in rec.items()}
+                for rec in recommendations]
+    
+    def _recommend_courses(self, user_skills, top_n):
+        """Rank courses by match percentage for the given skills"""
+        # Count every course's matched skills at once by popcounting the AND of
+        # the packed course rows with the user's packed skill row
+        skill_ids = [self._skill_id.get(skill) for skill in user_skills]
+        user_row = np.zeros(len(self._skill_id), dtype=bool)
+        user_row[np.array([i for i in skill_ids if i is not None], dtype=np.intp)] = True
+        matched_counts = _POPCOUNT_TABLE[self._skill_bitmatrix & np.packbits(user_row)].sum(axis=1)
+        
+        # Match percentage of each course that has skills
+        courses = self._courses_with_skills
+        match_percentages = (matched_counts[courses] / self._course_skill_counts[courses]) * 100
+        
+        # Select the top N by match percentage (highest first) without sorting every course
+        candidates = [(self._course_names[courses[i]], float(match_percentages[i]))
+                      for i in top_n_indices(match_percentages, top_n)]
+        
+        # Only work out skill details for the courses actually returned
+        user_skill_names = set(user_skills.keys())
+        # Format each user skill with its proficiency once, for reuse across courses
+        formatted_skills = {skill: format_user_skill(skill, proficiency)
+                            for skill, proficiency in user_skills.items()}
+        recommendations = []
+        for course_name, match_percentage in candidates:
             # Calculate matched and missing skills
-            matched_skills = required_skills.intersection(user_skill_names)
+            required_skills = self._course_skill_sets[course_name]
+            formatted_matched_skills = [formatted_skills[skill]
+                                        for skill in required_skills.intersection(user_skill_names)]
             missing_skills = required_skills - user_skill_names
             
-            # Calculate match percentage
-            match_percentage = 0
-            if required_skills:
-                match_percentage = (len(matched_skills) / len(required_skills)) * 100
-            
-            # Format matched skills with proficiency
-            formatted_matched_skills = []
-            for skill in matched_skills:
-                proficiency = user_skills[skill]
-                if isinstance(proficiency, dict):
-                    prof_value = proficiency.get("proficiency", "Intermediate")
-                    is_certified = proficiency.get("isBackedByCertificate", False)
-                    cert_text = " (certified)" if is_certified else ""
-                    formatted_matched_skills.append(f"{skill} ({prof_value}{cert_text})")
-                else:
-                    formatted_matched_skills.append(f"{skill} ({proficiency})")
-            
             # Add to recommendations
             recommendations.append({
                 'course_name': course_name,
@@ -73,10 +153,7 @@ class CourseRecommendationModel:
                 'missing_skills': list(missing_skills)
             })
         
-        # Sort by match percentage (highest first)
-        recommendations.sort(key=lambda x: x['match_percentage'], reverse=True)
-        
-        return recommendations[:top_n]
+        return recommendations
     
     def find_similar_courses(self, course_name, top_n=5):
         """
@@ -94,36 +171,27 @@ class CourseRecommendationModel:
             return []
             
         # Get skills for the target course
-        target_course_skills = set(self.course_data[course_name].get('required_skills', []))
+        target_idx = self._course_index[course_name]
         
-        if not target_course_skills:
+        if not self._course_skill_counts[target_idx]:
             return []
             
-        # Calculate similarity scores
-        similar_courses = []
-        for other_course, course_info in self.course_data.items():
-            if other_course == course_name:
-                continue
-                
-            other_course_skills = set(course_info.get('required_skills', []))
-            
-            if not other_course_skills:
-                continue
-                
-            # Calculate Jaccard similarity
-            intersection = len(target_course_skills.intersection(other_course_skills))
-            union = len(target_course_skills.union(other_course_skills))
-            
-            similarity_score = 0
-            if union > 0:
-                similarity_score = (intersection / union) * 100
-                
-            similar_courses.append({
-                'course_name': other_course,
-                'similarity_score': similarity_score
-            })
+        # Calculate Jaccard similarity against every course at once by
+        # popcounting the AND of the packed skill rows; the union size
+        # follows from the skill counts, so no second popcount pass is needed
+        target_row = self._skill_bitmatrix[target_idx]
+        intersections = _POPCOUNT_TABLE[self._skill_bitmatrix & target_row].sum(axis=1)
+        unions = self._course_skill_counts + self._course_skill_counts[target_idx] - intersections
+        
+        # Skip the course itself and courses without skills
+        candidates = np.flatnonzero(self._course_skill_counts)
+        candidates = candidates[candidates != target_idx]
+        similarity_scores = (intersections[candidates] / unions[candidates]) * 100
         
         # Sort by similarity score (highest first)
-        similar_courses.sort(key=lambda x: x['similarity_score'], reverse=True)
+        order = top_n_indices(similarity_scores, top_n)
         
-        return similar_courses[:top_n] 
\ No newline at end of file
+        return [{
+            'course_name': self._course_names[candidates[i]],
+            'similarity_score': float(similarity_scores[i])
+        } for i in order] 
\ No newline at end of file
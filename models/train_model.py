@@ -1,70 +1,130 @@
 import os
-import sys
 import pickle
-import json
+import functools
 import numpy as np
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+import scipy.sparse as sp
 from collections import defaultdict
 
-# Add project root to Python path
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from utils.json_utils import load_json
+from utils.lru_cache import LRUCache
+from models.recommendation_model import top_n_indices
+
+# Maximum number of (skills, top_n) results to keep per model
+RECOMMENDATION_CACHE_SIZE = 4096
 
 class CourseRecommendationModel:
-    def __init__(self, course_data_path):
+    def __init__(self, course_data_path, course_data=None):
         """Initialize the recommendation model with course data."""
         self.course_data_path = course_data_path
-        self.course_data = self._load_course_data()
-        self.all_skills = self._extract_all_skills()
-        self.skill_vectors = None
+        # Reuse already-parsed course data when the caller passes it in
+        self.course_data = course_data if course_data is not None else self._load_course_data()
+        self.all_skills = None
         self.course_vectors = None
         self.vectorizer = None
         self._build_skill_vectors()
+        # Recommendations keyed by (top_n, sorted skill names)
+        self._recommendation_cache = LRUCache(RECOMMENDATION_CACHE_SIZE)
         
     def _load_course_data(self):
-        """Load course data from JSON file."""
-        try:
-            with open(self.course_data_path, 'r') as f:
-                return json.load(f)
-        except Exception as e:
-            print(f"Error loading course data: {str(e)}")
-            return {}
+        """Load course data from JSON file, raising if it cannot be read."""
+        return load_json(self.course_data_path)
             
-    def _extract_all_skills(self):
-        """Extract all unique skills from course data."""
-        all_skills = set()
-        for course_info in self.course_data.values():
-            all_skills.update(course_info.get('required_skills', []))
-        return sorted(list(all_skills))
-        
     def _build_skill_vectors(self):
-        """Build TF-IDF vectors for skills and courses."""
-        # Create skill descriptions for TF-IDF
-        skill_descriptions = []
-        course_descriptions = []
+        """Build TF-IDF vectors for courses."""
+        # Collect course names, course descriptions and all unique skills in one pass
         course_names = []
-        
-        # Create descriptions for skills
-        for skill in self.all_skills:
-            skill_descriptions.append(skill)
-            
-        # Create descriptions for courses
+        course_descriptions = []
+        all_skills = set()
         for course_name, course_info in self.course_data.items():
             skills = course_info.get('required_skills', [])
-            course_descriptions.append(' '.join(skills))
             course_names.append(course_name)
+            course_descriptions.append(' '.join(skills))
+            all_skills.update(skills)
+        self.all_skills = sorted(all_skills)
             
-        # Create TF-IDF vectors
-        self.vectorizer = TfidfVectorizer(stop_words='english')
-        
-        # Fit on all documents (skills + courses)
-        all_documents = skill_descriptions + course_descriptions
-        self.vectorizer.fit(all_documents)
+        # Create TF-IDF vectors (sklearn is only imported when a model is built)
+        from sklearn.feature_extraction.text import TfidfVectorizer
+        # float32 halves the size of the course matrix used for similarity
+        self.vectorizer = TfidfVectorizer(stop_words='english', dtype=np.float32)
         
-        # Transform skills and courses
-        self.skill_vectors = self.vectorizer.transform(skill_descriptions)
-        self.course_vectors = self.vectorizer.transform(course_descriptions)
+        # Fit on the course descriptions only: every skill token already occurs
+        # in some course, and one document per skill would skew document frequencies
+        self.course_vectors = self.vectorizer.fit_transform(course_descriptions)
         self.course_names = course_names
+        self._course_index = {name: i for i, name in enumerate(course_names)}
+        self.course_similarities = self._compute_course_similarities()
+        self._cache_query_encoder()
+        
+    def _cache_query_encoder(self):
+        """Cache the fitted analyzer, vocabulary and idf weights used to build query vectors."""
+        self._analyzer = self.vectorizer.build_analyzer()
+        self._vocab = self.vectorizer.vocabulary_
+        self._idf = self.vectorizer.idf_.astype(np.float32)
+        # Column-major copy of the course matrix: the courses containing each
+        # term (its posting list) are one contiguous slice
+        self._course_postings = self.course_vectors.tocsc()
+        
+    def _compute_course_similarities(self):
+        """Compute the cosine similarity of every pair of courses (rows are L2-normalized)."""
+        return (self.course_vectors @ self.course_vectors.T).toarray()
+        
+    def save_fast(self, path):
+        """
+        Save the fitted arrays to an uncompressed .npz file.
+        
+        Only numpy arrays are written, so load_fast can rebuild the model without
+        unpickling or refitting. Course data is re-read from course_data_path,
+        which is stored relative to the .npz file so that the model and data
+        directories can be moved together.
+        """
+        course_data_path = os.path.relpath(os.path.abspath(self.course_data_path),
+                                           os.path.dirname(os.path.abspath(path)))
+        course_vectors = self.course_vectors.tocsr()
+        vocabulary = np.empty(len(self.vectorizer.vocabulary_), dtype=object)
+        for term, idx in self.vectorizer.vocabulary_.items():
+            vocabulary[idx] = term
+            
+        np.savez(
+            path,
+            course_data_path=np.array(course_data_path),
+            course_names=np.array(self.course_names, dtype=str),
+            all_skills=np.array(self.all_skills, dtype=str),
+            vocabulary=vocabulary.astype(str),
+            idf=self.vectorizer.idf_.astype(np.float32),
+            course_data_values=course_vectors.data,
+            course_indices=course_vectors.indices,
+            course_indptr=course_vectors.indptr,
+            course_shape=np.array(course_vectors.shape),
+            course_similarities=self.course_similarities.astype(np.float32)
+        )
+        
+    @classmethod
+    def load_fast(cls, path, course_data=None):
+        """Rebuild a model saved with save_fast, without refitting the vectorizer."""
+        with np.load(path) as arrays:
+            model = cls.__new__(cls)
+            model.course_data_path = os.path.normpath(
+                os.path.join(os.path.dirname(os.path.abspath(path)), str(arrays['course_data_path'])))
+            model.course_data = course_data if course_data is not None else model._load_course_data()
+            model.course_names = arrays['course_names'].tolist()
+            model._course_index = {name: i for i, name in enumerate(model.course_names)}
+            model.all_skills = arrays['all_skills'].tolist()
+            
+            # Restore the fitted vocabulary and idf weights
+            from sklearn.feature_extraction.text import TfidfVectorizer
+            model.vectorizer = TfidfVectorizer(stop_words='english', dtype=np.float32)
+            model.vectorizer.vocabulary_ = {term: i for i, term in enumerate(arrays['vocabulary'].tolist())}
+            model.vectorizer.idf_ = arrays['idf']
+            
+            model.course_vectors = sp.csr_matrix(
+                (arrays['course_data_values'], arrays['course_indices'], arrays['course_indptr']),
+                shape=tuple(arrays['course_shape'])
+            )
+            model.course_similarities = arrays['course_similarities']
+            model._cache_query_encoder()
+            model._recommendation_cache = LRUCache(RECOMMENDATION_CACHE_SIZE)
+            
+        return model
         
     def build_skill_vector(self, skills):
         """
@@ -76,12 +136,41 @@ class CourseRecommendationModel:
         Returns:
             numpy.ndarray: Skill vector
         """
+        token_ids, weights = self._query_terms(skills)
+        skill_vector = np.zeros(len(self._vocab), dtype=np.float32)
+        skill_vector[token_ids] = weights
+        return skill_vector
+        
+    def _query_terms(self, skills):
+        """
+        Return the vocabulary ids and TF-IDF weights of the terms in a skill list.
+        
+        Gives the same weights as vectorizer.transform, but looks the tokens up
+        directly instead of going through sklearn's validation and CSR building.
+        """
+        # Models pickled before the encoder was cached fill it in on first use
+        if getattr(self, '_vocab', None) is None:
+            self._cache_query_encoder()
+            
         if isinstance(skills, dict):
             skill_text = ' '.join(skills.keys())
         else:
             skill_text = ' '.join(skills)
             
-        return self.vectorizer.transform([skill_text]).toarray()[0]
+        # Raw term counts, then idf weighting and L2 normalization
+        counts = defaultdict(int)
+        for token in self._analyzer(skill_text):
+            token_id = self._vocab.get(token)
+            if token_id is not None:
+                counts[token_id] += 1
+                
+        token_ids = np.fromiter(counts.keys(), dtype=np.intp, count=len(counts))
+        weights = np.fromiter(counts.values(), dtype=np.float32, count=len(counts)) * self._idf[token_ids]
+        norm = np.linalg.norm(weights)
+        if norm > 0:
+            weights /= norm
+            
+        return token_ids, weights
         
     def recommend_courses(self, skills, top_n=10):
         """
@@ -94,16 +183,36 @@ class CourseRecommendationModel:
         Returns:
             list: List of recommended courses sorted by relevance
         """
-        # Convert skills to skill vector
-        skill_vector = self.build_skill_vector(skills)
+        # Models pickled before results were cached start with an empty cache
+        if getattr(self, '_recommendation_cache', None) is None:
+            self._recommendation_cache = LRUCache(RECOMMENDATION_CACHE_SIZE)
+            
+        # Only the skill names (not their order) affect the result
+        key = (top_n, tuple(sorted(skills)))
+        recommendations = self._recommendation_cache.get(key)
+        if recommendations is None:
+            recommendations = self._recommend_courses(skills, top_n)
+            self._recommendation_cache.put(key, recommendations)
+            
+        # Hand out copies so callers cannot modify the cached results
+        return [dict(rec) for rec in recommendations]
+        
+    def _recommend_courses(self, skills, top_n):
+        """Rank courses by TF-IDF cosine similarity to the given skills."""
+        # Convert skills to their TF-IDF terms
+        token_ids, weights = self._query_terms(skills)
         
-        # Calculate similarity with all courses at once
-        similarities = cosine_similarity([skill_vector], self.course_vectors)[0]
+        # TF-IDF rows are already L2-normalized, so the dot product with each
+        # course is its cosine similarity; only the posting lists of the query's
+        # terms contribute to it
+        postings = self._course_postings
+        similarities = np.zeros(len(self.course_names), dtype=np.float32)
+        for token_id, weight in zip(token_ids, weights):
+            start, end = postings.indptr[token_id], postings.indptr[token_id + 1]
+            similarities[postings.indices[start:end]] += weight * postings.data[start:end]
             
         # Get indices of top similar courses
-        if top_n is None:
-            top_n = len(similarities)
-        top_indices = similarities.argsort()[-top_n:][::-1]
+        top_indices = top_n_indices(similarities, top_n)
         
         # Return recommended courses
         recommendations = []
@@ -117,17 +226,22 @@ class CourseRecommendationModel:
         
     def find_similar_courses(self, course_name, top_n=5):
         """Find courses similar to a given course."""
-        if course_name not in self.course_data:
+        # Get course index (models pickled before the index was built fill it in on first use)
+        if getattr(self, '_course_index', None) is None:
+            self._course_index = {name: i for i, name in enumerate(self.course_names)}
+        course_idx = self._course_index.get(course_name)
+        if course_idx is None:
             return []
-            
-        # Get course index
-        course_idx = self.course_names.index(course_name)
         
-        # Calculate similarity with all other courses
-        similarities = cosine_similarity(self.course_vectors[course_idx:course_idx+1], self.course_vectors)[0]
+        # Look up the precomputed similarities with all other courses
+        # (models pickled before they were precomputed fill them in on first use)
+        if getattr(self, 'course_similarities', None) is None:
+            self.course_similarities = self._compute_course_similarities()
+        similarities = self.course_similarities[course_idx].copy()
+        similarities[course_idx] = -np.inf
         
         # Get top N similar courses (excluding the input course)
-        similar_indices = similarities.argsort()[-top_n-1:-1][::-1]
+        similar_indices = top_n_indices(similarities, min(top_n, len(similarities) - 1))
         
         similar_courses = []
         for idx in similar_indices:
@@ -138,8 +252,25 @@ class CourseRecommendationModel:
             
         return similar_courses
 
+@functools.lru_cache(maxsize=4)
+def get_recommendation_model(course_data_path):
+    """
+    Return a CourseRecommendationModel for the data file, built once per process.
+    
+    The instance is shared between callers and must not be modified.
+    """
+    return CourseRecommendationModel(course_data_path)
+
 def load_trained_model():
     """Load the trained recommendation model."""
+    model_path = os.path.join(os.path.dirname(__file__), 'trained_model.npz')
+    if os.path.exists(model_path):
+        try:
+            return CourseRecommendationModel.load_fast(model_path)
+        except Exception as e:
+            print(f"Error loading {model_path}: {str(e)}")
+            
+    # Fall back to a model pickled by an older version
     model_path = os.path.join(os.path.dirname(__file__), 'trained_model.pkl')
     if os.path.exists(model_path):
         with open(model_path, 'rb') as f:
@@ -169,12 +300,10 @@ def train_model():
         # Count total number of courses
         print(f"Total courses loaded: {len(model.course_data)}")
         
-        # Save the trained model
-        model_path = os.path.join(os.path.dirname(__file__), 'trained_model.pkl')
+        # Save the trained model's arrays
+        model_path = os.path.join(os.path.dirname(__file__), 'trained_model.npz')
         print(f"Saving trained model to {model_path}...")
-        
-        with open(model_path, 'wb') as f:
-            pickle.dump(model, f)
+        model.save_fast(model_path)
         
         print("Model training completed and saved successfully!")
         
@@ -1,7 +1,4 @@
 import argparse
-import os
-import sys
-import subprocess
 
 def main():
     parser = argparse.ArgumentParser(description='Faculty Skill Development System')
@@ -10,53 +7,35 @@ def main():
     
     args = parser.parse_args()
     
+    # Run each action in this process rather than a new Python interpreter
     if args.action == 'api':
         print("Starting the API server...")
-        subprocess.run([sys.executable, 'src/api.py'])
+        from src import api
+        api.main()
     
     elif args.action == 'web':
         print("Starting the web application...")
-        subprocess.run([sys.executable, 'src/app.py'])
+        from src import app
+        app.main()
         
     elif args.action == 'build-graph':
         print("Building the skill knowledge graph...")
-        
-        # Ensure required packages are installed
-        try:
-            import networkx
-            import matplotlib
-        except ImportError:
-            print("Installing required packages...")
-            subprocess.run([sys.executable, '-m', 'pip', 'install', 'networkx', 'matplotlib'])
-            
-        # Run the skill graph builder
-        subprocess.run([sys.executable, 'utils/skill_graph.py'])
+        from utils import skill_graph
+        skill_graph.main()
         
     elif args.action == 'faculty':
         print("Starting the Faculty Skills Development Advisor...")
         
-        # Check if required packages are installed
-        try:
-            import numpy
-        except ImportError:
-            print("Installing required packages...")
-            subprocess.run([sys.executable, '-m', 'pip', 'install', 'numpy', 'pandas'])
-            
         # Run the faculty advisor in interactive mode
-        subprocess.run([sys.executable, 'scripts/faculty_development_advisor.py', '--interactive'])
+        from scripts import faculty_development_advisor
+        faculty_development_advisor.main(['--interactive'])
 
     elif args.action == 'faculty-teaching':
         print("Starting the Faculty Teaching Advisor...")
         
-        # Check if required packages are installed
-        try:
-            import numpy
-        except ImportError:
-            print("Installing required packages...")
-            subprocess.run([sys.executable, '-m', 'pip', 'install', 'numpy', 'pandas'])
-            
         # Run the faculty teaching advisor in interactive mode
-        subprocess.run([sys.executable, 'scripts/faculty_teaching_advisor.py', '--interactive'])
+        from scripts import faculty_teaching_advisor
+        faculty_teaching_advisor.main(['--interactive'])
 
 if __name__ == '__main__':
     main() 
\ No newline at end of file
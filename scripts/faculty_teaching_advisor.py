@@ -2,14 +2,14 @@ import json
 import os
 import sys
 import argparse
+import functools
 from collections import defaultdict
 
 # Add parent directory to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 # Import from other modules
-from utils.skill_matcher import SkillMatcher
-from models.train_model import load_trained_model, CourseRecommendationModel
+from models.train_model import load_trained_model, get_recommendation_model
 
 class FacultyTeachingAdvisor:
     """
@@ -25,10 +25,14 @@ class FacultyTeachingAdvisor:
         # If no trained model exists, create a new one
         if not self.model:
             print("No trained model found. Training new model...")
-            self.model = CourseRecommendationModel(course_data_path)
+            self.model = get_recommendation_model(course_data_path)
         
         self.course_data_path = course_data_path
         self.course_data = self.model.course_data
+        
+        # Each course's required skills as a set, built once
+        self.course_skill_sets = {course_name: frozenset(course_info.get("required_skills", []))
+                                  for course_name, course_info in self.course_data.items()}
     
     def identify_skill_gaps(self, faculty_skills, threshold=30):
         """
@@ -42,20 +46,21 @@ class FacultyTeachingAdvisor:
             dict: Dictionary containing faculty skills and courses with skill gaps
         """
         # Get course recommendations based on faculty skills
+        # The model caches its results, so both methods share them for the same skills
         recommendations = self.model.recommend_courses(faculty_skills, top_n=None)
         
         # Convert similarity scores to percentages and filter by threshold
         skill_gap_courses = []
+        faculty_skill_names = set(faculty_skills.keys())
         for course in recommendations:
             match_percentage = course["similarity"] * 100
             if match_percentage >= threshold:
                 course_name = course["course"]
-                course_info = self.course_data[course_name]
-                required_skills = set(course_info.get("required_skills", []))
+                required_skills = self.course_skill_sets[course_name]
                 
                 # Calculate matched and missing skills
-                matched_skills = required_skills.intersection(set(faculty_skills.keys()))
-                missing_skills = required_skills - set(faculty_skills.keys())
+                matched_skills = required_skills.intersection(faculty_skill_names)
+                missing_skills = required_skills - faculty_skill_names
                 
                 # Only include courses where there are both matched and missing skills
                 if matched_skills and missing_skills:
@@ -99,16 +104,16 @@ class FacultyTeachingAdvisor:
         
         # Convert similarity scores to percentages and filter by threshold
         teachable_courses = []
+        faculty_skill_names = set(faculty_skills.keys())
         for course in recommendations:
             match_percentage = course["similarity"] * 100
             if match_percentage >= threshold:
                 course_name = course["course"]
-                course_info = self.course_data[course_name]
-                required_skills = set(course_info.get("required_skills", []))
+                required_skills = self.course_skill_sets[course_name]
                 
                 # Calculate matched and missing skills
-                matched_skills = required_skills.intersection(set(faculty_skills.keys()))
-                missing_skills = required_skills - set(faculty_skills.keys())
+                matched_skills = required_skills.intersection(faculty_skill_names)
+                missing_skills = required_skills - faculty_skill_names
                 
                 # Format matched skills with proficiency and certification
                 formatted_matched_skills = []
@@ -186,6 +191,15 @@ class FacultyTeachingAdvisor:
         
         return output
 
+@functools.lru_cache(maxsize=4)
+def get_teaching_advisor(course_data_path='data/enhanced_course_skills.json'):
+    """
+    Return a FacultyTeachingAdvisor for the data file, created once per process.
+    
+    The advisor is shared between requests and must not be modified.
+    """
+    return FacultyTeachingAdvisor(course_data_path)
+
 def interactive_teaching_advisor():
     """
     Interactive mode for faculty members to get teaching recommendations and identify skill gaps.
@@ -281,9 +295,12 @@ def interactive_teaching_advisor():
     print(f"\nDetailed analysis saved to {output_file}")
     print("\nThank you for using the Faculty Teaching Advisor!")
 
-def main():
+def main(argv=None):
     """
     Main function to parse arguments and run the advisor.
+    
+    Args:
+        argv (list, optional): Command-line arguments; defaults to sys.argv[1:]
     """
     parser = argparse.ArgumentParser(description='Faculty Teaching Advisor')
     parser.add_argument('--interactive', '-i', action='store_true', 
@@ -293,7 +310,7 @@ def main():
     parser.add_argument('--output', '-o', type=str, default='data/faculty_analysis',
                         help='Output directory for analysis results')
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     if args.interactive:
         interactive_teaching_advisor()
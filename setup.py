@@ -42,10 +42,12 @@ def main():
         print("\nBuilding skill knowledge graph...")
         
         # Check if the script exists
-        skill_graph_script = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'utils', 'skill_graph.py')
+        project_dir = os.path.dirname(os.path.abspath(__file__))
+        skill_graph_script = os.path.join(project_dir, 'utils', 'skill_graph.py')
         
         if os.path.exists(skill_graph_script):
-            subprocess.run([sys.executable, skill_graph_script])
+            # Run it as a module so its package-relative imports resolve
+            subprocess.run([sys.executable, '-m', 'utils.skill_graph'], cwd=project_dir)
         else:
             print(f"Error: Skill graph script not found at {skill_graph_script}")
             print("Please run the enhanced mode to build the skill graph automatically.")
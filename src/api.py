@@ -5,8 +5,8 @@ import sys
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from flask import Flask, request, jsonify
-from models.recommendation_model import CourseRecommendationModel
 from models.train_model import load_trained_model
+from models.learning_path import get_learning_path_generator
 from utils.input_processor import parse_user_skills, format_explanation
 from utils.visualization import generate_skill_gap_chart, generate_recommendation_explanation
 import uuid
@@ -186,20 +186,17 @@ def learning_path():
     else:
         user_skills = data['skills']
     
-    # Get user_id and career goal
-    user_id = data.get('user_id', session_id)
-    career_goal = data.get('career_goal')
+    # The path generator takes plain proficiency labels
+    user_skills = {skill: info.get('proficiency', 'Intermediate') if isinstance(info, dict) else info
+                   for skill, info in user_skills.items()}
     
-    # Update user profile
-    model.create_user_profile(user_id, skills=user_skills)
-    if career_goal:
-        model.create_user_profile(user_id, career_goals=[career_goal])
-    
-    # Get path length
+    # Get career goal and path length
+    career_goal = data.get('career_goal')
     path_length = data.get('path_length', 5)
     
-    # Generate learning path
-    learning_path = model.generate_learning_path(user_id, career_goal, path_length)
+    # Generate learning path with the generator shared across requests
+    path_generator = get_learning_path_generator(model.course_data_path)
+    learning_path = path_generator.generate_learning_path(user_skills, career_goal, path_length)
     
     return jsonify({'learning_path': learning_path})
 
@@ -222,5 +219,9 @@ def certificate_info():
         ]
     })
 
+def main():
+    """Run the API server."""
+    app.run(debug=True, port=5002)
+
 if __name__ == '__main__':
-    app.run(debug=True, port=5002) 
\ No newline at end of file
+    main() 
\ No newline at end of file
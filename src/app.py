@@ -3,7 +3,7 @@ import sys
 import json
 from flask import Flask, request, jsonify, render_template, redirect, url_for, send_file
 from utils.faculty_skills_analyzer import FacultySkillsAnalyzer
-from scripts.faculty_teaching_advisor import FacultyTeachingAdvisor
+from scripts.faculty_teaching_advisor import get_teaching_advisor
 from models.train_model import load_trained_model, train_model
 import matplotlib
 matplotlib.use('Agg')  # Use non-interactive backend for chart generation
@@ -15,7 +15,7 @@ app = Flask(__name__, template_folder='templates', static_folder='static')
 
 # Ensure the model is trained
 print("Checking if model needs to be trained...")
-if not os.path.exists(os.path.join(os.path.dirname(__file__), '..', 'models', 'trained_model.pkl')):
+if not os.path.exists(os.path.join(os.path.dirname(__file__), '..', 'models', 'trained_model.npz')):
     print("No trained model found. Training new model...")
     train_model()
 
@@ -159,8 +159,8 @@ def faculty_teaching():
                 print(f"  - {skill}: {details}")
             print(f"DEBUG: Threshold set to: {threshold}%")
             
-            # Initialize advisor with trained model
-            advisor = FacultyTeachingAdvisor()
+            # Reuse the advisor (and its trained model) across requests
+            advisor = get_teaching_advisor()
             
             # Debug available courses
             try:
@@ -169,14 +169,18 @@ def faculty_teaching():
             except Exception as e:
                 print(f"DEBUG: Error accessing course data: {e}")
             
-            # Identify skill gaps using the trained model
-            skill_gaps = advisor.identify_skill_gaps(faculty_skills, threshold=threshold)
+            # Identify skill gaps using the trained model, once, at the lowest
+            # threshold we might fall back to
+            lower_threshold = max(10, threshold - 20)  # Don't go below 10%
+            skill_gaps = advisor.identify_skill_gaps(faculty_skills, threshold=min(threshold, lower_threshold))
+            all_gap_courses = skill_gaps['skill_gap_courses']
             
-            # If we don't have enough skill gaps, try with a lower threshold
+            skill_gaps['skill_gap_courses'] = [c for c in all_gap_courses if c['match_percentage'] >= threshold]
+            
+            # If we don't have enough skill gaps, use the lower threshold instead
             if len(skill_gaps['skill_gap_courses']) < 10:
-                lower_threshold = max(10, threshold - 20)  # Don't go below 10%
                 print(f"DEBUG: Not enough skill gaps found, trying lower threshold {lower_threshold}%")
-                skill_gaps = advisor.identify_skill_gaps(faculty_skills, threshold=lower_threshold)
+                skill_gaps['skill_gap_courses'] = [c for c in all_gap_courses if c['match_percentage'] >= lower_threshold]
             
             # Save analysis to file
             output_dir = 'data/faculty_analysis'
@@ -200,7 +204,8 @@ def faculty_teaching():
         skills_input=skills_input
     )
 
-if __name__ == '__main__':
+def main():
+    """Create any missing page templates, then run the web application."""
     # Create templates directory if it doesn't exist
     templates_dir = os.path.join(os.path.dirname(__file__), 'templates')
     static_dir = os.path.join(os.path.dirname(__file__), 'static')
@@ -731,4 +736,7 @@ if __name__ == '__main__':
         with open(faculty_teaching_template_path, 'w') as f:
             f.write(faculty_teaching_template)
     
-    app.run(debug=True, port=5001)
\ No newline at end of file
+    app.run(debug=True, port=5001)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,31 @@
+import os
+import shutil
+from types import SimpleNamespace
+
+import pytest
+
+from src import api
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data')
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    """API test client whose model points at a scratch copy of the course data"""
+    course_skills_path = str(tmp_path / 'course_skills.json')
+    shutil.copy(os.path.join(DATA_DIR, 'course_skills.json'), course_skills_path)
+    monkeypatch.setattr(api, 'model', SimpleNamespace(course_data_path=course_skills_path))
+    return api.app.test_client()
+
+
+@pytest.mark.parametrize('skills', [
+    "HTML : Advanced, CSS : Intermediate : true, JavaScript : Beginner",
+    {"HTML": "Advanced", "CSS": "Intermediate", "JavaScript": "Beginner"},
+    {"HTML": {"proficiency": "Advanced"}, "CSS": {"proficiency": "Intermediate", "isBackedByCertificate": True},
+     "JavaScript": {"proficiency": "Beginner"}},
+])
+def test_learning_path_accepts_every_skill_format(client, skills):
+    response = client.post('/api/learning_path', json={'skills': skills, 'path_length': 3})
+    
+    assert response.status_code == 200
+    assert response.get_json()['learning_path']
@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+
+from utils import json_utils
+
+COURSES = {
+    'Data Structures': {'required_skills': ['Python', 'Algorithmen für Einsteiger']},
+    'Web Design': {'required_skills': ['HTML', 'CSS'], 'credits': 3},
+}
+
+
+DATA = {
+    'Data Structures': {'required_skills': ['Python', 'Algorithmen für Einsteiger']},
+    1: np.float64(0.5),
+    'counts': np.array([1, 2, 3]),
+    'weight': np.int64(3),
+}
+
+EXPECTED = {
+    'Data Structures': {'required_skills': ['Python', 'Algorithmen für Einsteiger']},
+    '1': 0.5,
+    'counts': [1, 2, 3],
+    'weight': 3,
+}
+
+
+@pytest.fixture(params=['orjson', 'json'])
+def encoder(request, monkeypatch):
+    """Run each test with orjson and with the standard json fallback"""
+    if request.param == 'orjson':
+        pytest.importorskip('orjson')
+    else:
+        monkeypatch.setattr(json_utils, 'orjson', None)
+    return request.param
+
+
+def test_load_json_reads_utf8(encoder, tmp_path):
+    path = tmp_path / 'courses.json'
+    path.write_text('{"Data Structures": {"required_skills": ["Python", "Algorithmen für Einsteiger"]}, '
+                    '"Web Design": {"required_skills": ["HTML", "CSS"], "credits": 3}}', encoding='utf-8')
+    
+    assert json_utils.load_json(str(path)) == COURSES
+
+
+def test_dump_and_load_round_trip(encoder, tmp_path):
+    path = str(tmp_path / 'data.json')
+    json_utils.dump_json(DATA, path)
+    
+    assert json_utils.load_json(path) == EXPECTED
+
+
+def test_both_encoders_write_the_same_file(tmp_path, monkeypatch):
+    pytest.importorskip('orjson')
+    orjson_path = str(tmp_path / 'orjson.json')
+    json_path = str(tmp_path / 'json.json')
+    
+    json_utils.dump_json(DATA, orjson_path)
+    monkeypatch.setattr(json_utils, 'orjson', None)
+    json_utils.dump_json(DATA, json_path)
+    
+    with open(orjson_path, 'rb') as f, open(json_path, 'rb') as g:
+        assert f.read() == g.read()
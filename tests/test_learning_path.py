@@ -0,0 +1,84 @@
+import glob
+import os
+import shutil
+
+import pytest
+
+from models.learning_path import LearningPathGenerator
+from utils.skill_graph import SkillGraph
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data')
+
+
+@pytest.fixture
+def course_skills_path(tmp_path):
+    """Course catalog and saved skill graph in a scratch data directory"""
+    path = str(tmp_path / 'course_skills.json')
+    shutil.copy(os.path.join(DATA_DIR, 'course_skills.json'), path)
+    
+    skill_graph = SkillGraph(path)
+    skill_graph.initialize_common_relationships()
+    skill_graph.save_graph(str(tmp_path / 'skill_graph.json'))
+    return path
+
+
+def cached_course_graphs(course_skills_path):
+    return glob.glob(os.path.join(os.path.dirname(course_skills_path), 'cache', 'course_graph.*.pkl'))
+
+
+def test_second_generator_loads_cached_course_graph(course_skills_path, monkeypatch):
+    first = LearningPathGenerator(course_skills_path)
+    assert len(cached_course_graphs(course_skills_path)) == 1
+    
+    def rebuild(self):
+        raise AssertionError("course graph was rebuilt instead of loaded from the cache")
+    
+    monkeypatch.setattr(LearningPathGenerator, '_build_course_dependency_graph', rebuild)
+    second = LearningPathGenerator(course_skills_path)
+    
+    assert list(second.course_graph.edges(data=True)) == list(first.course_graph.edges(data=True))
+
+
+def test_parsed_course_data_is_not_cached(course_skills_path):
+    course_data = LearningPathGenerator(course_skills_path).course_data
+    for cache_path in cached_course_graphs(course_skills_path):
+        os.remove(cache_path)
+    
+    LearningPathGenerator(course_skills_path, course_data=course_data)
+    
+    assert cached_course_graphs(course_skills_path) == []
+
+
+def test_catalogs_in_one_directory_keep_separate_caches(course_skills_path):
+    enhanced_path = os.path.join(os.path.dirname(course_skills_path), 'enhanced_course_skills.json')
+    shutil.copy(course_skills_path, enhanced_path)
+    
+    LearningPathGenerator(course_skills_path)
+    LearningPathGenerator(enhanced_path)
+    
+    names = sorted(os.path.basename(path).split('.')[1] for path in cached_course_graphs(course_skills_path))
+    assert names == ['course_skills', 'enhanced_course_skills']
+
+
+def test_stale_cache_of_the_same_catalog_is_removed(course_skills_path):
+    LearningPathGenerator(course_skills_path)
+    (old_cache,) = cached_course_graphs(course_skills_path)
+    
+    stat = os.stat(course_skills_path)
+    os.utime(course_skills_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    LearningPathGenerator(course_skills_path)
+    
+    (new_cache,) = cached_course_graphs(course_skills_path)
+    assert new_cache != old_cache
+
+
+def test_career_aligned_courses_cache_skips_unknown_goals(course_skills_path):
+    generator = LearningPathGenerator(course_skills_path)
+    career_goal = generator.course_names[0]
+    
+    assert generator.get_career_aligned_courses("Not a course") == []
+    assert len(generator._career_cache) == 0
+    
+    aligned_courses = generator.get_career_aligned_courses(career_goal)
+    assert generator.get_career_aligned_courses(career_goal) == aligned_courses
+    assert len(generator._career_cache) == 1
@@ -0,0 +1,41 @@
+import os
+import shutil
+
+import pytest
+
+from models.train_model import CourseRecommendationModel
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data')
+
+
+@pytest.fixture
+def saved_model(tmp_path):
+    """Model trained on a scratch copy of the course data and saved under models/"""
+    project_dir = tmp_path / 'trained'
+    (project_dir / 'data').mkdir(parents=True)
+    (project_dir / 'models').mkdir()
+    course_skills_path = str(project_dir / 'data' / 'course_skills.json')
+    shutil.copy(os.path.join(DATA_DIR, 'course_skills.json'), course_skills_path)
+    
+    model = CourseRecommendationModel(course_skills_path)
+    model.save_fast(str(project_dir / 'models' / 'trained_model.npz'))
+    return model, project_dir
+
+
+def test_load_fast_finds_course_data_after_moving_the_project(saved_model, tmp_path):
+    model, project_dir = saved_model
+    moved_dir = tmp_path / 'deployed'
+    shutil.move(str(project_dir), str(moved_dir))
+    
+    loaded = CourseRecommendationModel.load_fast(str(moved_dir / 'models' / 'trained_model.npz'))
+    
+    assert loaded.course_data_path == str(moved_dir / 'data' / 'course_skills.json')
+    assert loaded.course_data == model.course_data
+
+
+def test_load_fast_raises_without_course_data(saved_model):
+    _, project_dir = saved_model
+    os.remove(project_dir / 'data' / 'course_skills.json')
+    
+    with pytest.raises(FileNotFoundError):
+        CourseRecommendationModel.load_fast(str(project_dir / 'models' / 'trained_model.npz'))
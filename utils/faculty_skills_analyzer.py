@@ -1,15 +1,13 @@
 import json
 import os
-import sys
 import numpy as np
 from collections import defaultdict
+from functools import cached_property
 
-# Add parent directory to path to import from sibling modules if needed
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
-from utils.skills_mapper import SkillsMapper
-from utils.skill_categories import SkillCategories
-from utils.department_skills import get_department_skills
+from .json_utils import dump_json
+from .skills_mapper import SkillsMapper
+from .skill_categories import SkillCategories
+from .department_skills import get_department_skills
 
 class FacultySkillsAnalyzer:
     """
@@ -26,9 +24,24 @@ class FacultySkillsAnalyzer:
             skill_embeddings_file (str): Path to the skill embeddings file
             industry_skills_file (str): Path to file containing in-demand industry skills
         """
-        self.skills_mapper = SkillsMapper(skill_embeddings_file)
-        self.skill_categories = SkillCategories()
-        self.industry_skills = self.load_industry_skills(industry_skills_file)
+        # Only store the paths here; the subsystems are built on first access
+        self.skill_embeddings_file = skill_embeddings_file
+        self.industry_skills_file = industry_skills_file
+    
+    @cached_property
+    def skills_mapper(self):
+        """Skills mapper, loaded from the embeddings file on first use."""
+        return SkillsMapper(self.skill_embeddings_file)
+    
+    @cached_property
+    def skill_categories(self):
+        """Skill categories, loaded on first use."""
+        return SkillCategories()
+    
+    @cached_property
+    def industry_skills(self):
+        """In-demand industry skills, loaded on first use."""
+        return self.load_industry_skills(self.industry_skills_file)
         
     def load_industry_skills(self, filename):
         """
@@ -89,8 +102,8 @@ class FacultySkillsAnalyzer:
         dept_skills = get_department_skills(department)
         required_skills = dept_skills['core_skills'] + dept_skills['advanced_skills']
         
-        # Normalize skills for comparison
-        faculty_skills = [skill.lower().strip() for skill in faculty_skills]
+        # Normalize skills for comparison; faculty skills are only used for membership tests
+        faculty_skills = {skill.lower().strip() for skill in faculty_skills}
         required_skills = [skill.lower().strip() for skill in required_skills]
         
         # Find matched skills
@@ -115,9 +128,10 @@ class FacultySkillsAnalyzer:
         # Categorize gaps by priority
         high_priority = []
         medium_priority = []
+        core_skills = set(dept_skills['core_skills'])
         
         for gap in skill_gaps:
-            if gap in dept_skills['core_skills']:
+            if gap in core_skills:
                 high_priority.append(gap)
             else:
                 medium_priority.append(gap)
@@ -240,12 +254,12 @@ class FacultySkillsAnalyzer:
         # Ensure directory exists
         os.makedirs(os.path.dirname(filename), exist_ok=True)
         
-        with open(filename, 'w') as f:
-            json.dump(analysis, f, indent=2)
+        dump_json(analysis, filename)
         
         print(f"Saved faculty skill analysis to {filename}")
 
 if __name__ == "__main__":
+    # Run as a module from the project root: python -m utils.faculty_skills_analyzer
     # Example usage
     analyzer = FacultySkillsAnalyzer()
     
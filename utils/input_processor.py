@@ -125,6 +125,24 @@ def format_similar_courses(similar_courses, original_course=None):
     return output
 
 
+# Fixed pieces of the recommendation explanation text
+_SKILL_MATCH_TEMPLATE = "1. You already have {count} relevant skills for this course ({match}% skill match).\n"
+_NO_SKILL_MATCH_TEXT = "1. This course introduces new skills that complement your existing knowledge.\n\n"
+_RATING_TEMPLATE = "2. Users with similar skill profiles rated this course highly (predicted rating: {rating:.1f}/5.0).\n\n"
+_SKILL_SET_TEXT = "3. This course would help you develop a more comprehensive skill set "
+_OVERALL_STRONG_TEXT = "Overall: You're well-prepared for this course! Your existing skills provide a strong foundation.\n"
+_OVERALL_GOOD_TEXT = "Overall: You have a good foundation for this course, with some areas to strengthen beforehand.\n"
+_OVERALL_CHALLENGING_TEXT = "Overall: This course would be challenging but valuable for expanding your skill set.\n"
+
+
+def _summarize_skills(skills):
+    """List the first three skills, noting how many more there are"""
+    summary = ", ".join(skills[:3])
+    if len(skills) > 3:
+        summary += f", and {len(skills) - 3} more"
+    return summary
+
+
 def format_explanation(recommendation, user_skills):
     """
     Create a textual explanation of why a course was recommended
@@ -145,41 +163,32 @@ def format_explanation(recommendation, user_skills):
     missing_skills = recommendation.get('missing_skills', [])
     predicted_rating = recommendation.get('predicted_rating', None)
     
-    # Start with a general explanation
-    explanation = f"{course_name} was recommended because:\n\n"
+    # Collect the pieces and join once at the end
+    parts = [f"{course_name} was recommended because:\n\n"]
     
     # Skill match explanation
     if matched_skills:
-        skill_count = len(matched_skills)
-        explanation += f"1. You already have {skill_count} relevant skills for this course "
-        explanation += f"({match_percentage}% skill match).\n"
-        explanation += "   Key skills you have: " + ", ".join(matched_skills[:3])
-        if len(matched_skills) > 3:
-            explanation += f", and {len(matched_skills) - 3} more"
-        explanation += ".\n\n"
+        parts.append(_SKILL_MATCH_TEMPLATE.format(count=len(matched_skills), match=match_percentage))
+        parts.append("   Key skills you have: " + _summarize_skills(matched_skills) + ".\n\n")
     else:
-        explanation += f"1. This course introduces new skills that complement your existing knowledge.\n\n"
+        parts.append(_NO_SKILL_MATCH_TEXT)
     
     # Collaborative filtering explanation
     if predicted_rating:
-        explanation += f"2. Users with similar skill profiles rated this course highly "
-        explanation += f"(predicted rating: {predicted_rating:.1f}/5.0).\n\n"
+        parts.append(_RATING_TEMPLATE.format(rating=predicted_rating))
     
     # Career path alignment
-    explanation += f"3. This course would help you develop a more comprehensive skill set "
+    parts.append(_SKILL_SET_TEXT)
     if missing_skills:
-        explanation += f"by teaching you {len(missing_skills)} new skills.\n"
-        explanation += "   Skills you'll learn: " + ", ".join(missing_skills[:3])
-        if len(missing_skills) > 3:
-            explanation += f", and {len(missing_skills) - 3} more"
-        explanation += ".\n\n"
+        parts.append(f"by teaching you {len(missing_skills)} new skills.\n")
+        parts.append("   Skills you'll learn: " + _summarize_skills(missing_skills) + ".\n\n")
     
     # Add customized advice
     if match_percentage >= 75:
-        explanation += "Overall: You're well-prepared for this course! Your existing skills provide a strong foundation.\n"
+        parts.append(_OVERALL_STRONG_TEXT)
     elif match_percentage >= 50:
-        explanation += "Overall: You have a good foundation for this course, with some areas to strengthen beforehand.\n"
+        parts.append(_OVERALL_GOOD_TEXT)
     else:
-        explanation += "Overall: This course would be challenging but valuable for expanding your skill set.\n"
+        parts.append(_OVERALL_CHALLENGING_TEXT)
     
-    return explanation 
\ No newline at end of file
+    return "".join(parts) 
\ No newline at end of file
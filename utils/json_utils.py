@@ -0,0 +1,60 @@
+"""
+JSON loading and saving helpers that use orjson when it is installed.
+
+orjson is pinned in requirements.txt. The standard json module is kept as a
+fallback and is set up to write the same output.
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def load_json(path):
+    """
+    Load a JSON file, parsing it with orjson if available.
+
+    Args:
+        path (str): Path to the JSON file
+
+    Returns:
+        The decoded JSON data
+    """
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _to_builtin(obj):
+    """Convert numpy scalars and arrays, which json cannot encode, to Python values."""
+    if hasattr(obj, 'tolist'):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dump_json(data, path):
+    """
+    Write data to a JSON file with 2-space indentation in a single write,
+    encoding it with orjson if available.
+
+    Both encoders write UTF-8, accept numpy scalars and arrays, and turn
+    non-string dict keys into strings, as json.dumps does.
+
+    Args:
+        data: JSON-serializable data
+        path (str): Path to the output file
+    """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=option))
+        return
+
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(json.dumps(data, indent=2, ensure_ascii=False, default=_to_builtin))
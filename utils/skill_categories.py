@@ -1,9 +1,7 @@
 import json
 import os
-import sys
 
-# Add parent directory to path if needed
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from .json_utils import dump_json
 
 class SkillCategories:
     """
@@ -49,8 +47,7 @@ class SkillCategories:
         # Ensure directory exists
         os.makedirs(os.path.dirname(output_file), exist_ok=True)
         
-        with open(output_file, 'w') as f:
-            json.dump(self.categories, f, indent=2)
+        dump_json(self.categories, output_file)
             
         print(f"Saved {len(self.categories)} skill categories to {output_file}")
         
@@ -1,11 +1,19 @@
 import json
 import os
+import sys
+import heapq
 import networkx as nx
-import matplotlib.pyplot as plt
 from collections import defaultdict
 
+from .json_utils import load_json
+
+# Proficiency levels as integers, with their display names and skill weights
+PROFICIENCY_LEVELS = {"beginner": 0, "intermediate": 1, "advanced": 2, "expert": 3}
+PROFICIENCY_NAMES = ["Beginner", "Intermediate", "Advanced", "Expert"]
+PROFICIENCY_WEIGHTS = [0.25, 0.5, 0.75, 1.0]
+
 class SkillGraph:
-    def __init__(self, course_skills_path=None):
+    def __init__(self, course_skills_path=None, course_data=None):
         """Initialize skill graph from course data"""
         self.graph = nx.DiGraph()
         self.skill_relationships = {
@@ -16,8 +24,8 @@ class SkillGraph:
         self.skill_aliases = self._create_skill_aliases()
         
         # Load course skills to build initial relationships
-        if course_skills_path:
-            self.load_course_data(course_skills_path)
+        if course_skills_path or course_data is not None:
+            self.load_course_data(course_skills_path, course_data)
             
     def _create_skill_aliases(self):
         """Create a dictionary of common skill aliases and their full names"""
@@ -45,17 +53,23 @@ class SkillGraph:
             'Azure': 'Microsoft Azure'
         }
             
-    def load_course_data(self, course_skills_path):
+    def load_course_data(self, course_skills_path, course_data=None):
         """Load course data and build initial skill relationships"""
-        with open(course_skills_path, 'r') as f:
-            course_data = json.load(f)
+        # Reuse already-parsed course data when the caller passes it in
+        if course_data is None:
+            course_data = load_json(course_skills_path)
             
         # First, collect all skills by frequency
         skill_frequency = defaultdict(int)
         skill_courses = defaultdict(list)
         
-        for course_name, course_info in course_data.items():
-            for skill in course_info['required_skills']:
+        # Intern skill names, which are hashed repeatedly while building edges,
+        # into lists of our own rather than rewriting the caller's course_data
+        course_skills = {course_name: [sys.intern(skill) for skill in course_info['required_skills']]
+                         for course_name, course_info in course_data.items()}
+        
+        for course_name, skills in course_skills.items():
+            for skill in skills:
                 skill_frequency[skill] += 1
                 skill_courses[skill].append(course_name)
         
@@ -64,9 +78,7 @@ class SkillGraph:
             self.graph.add_node(skill, frequency=skill_frequency[skill], courses=skill_courses[skill])
         
         # Build relationships based on co-occurrence
-        for course_name, course_info in course_data.items():
-            skills = course_info['required_skills']
-            
+        for skills in course_skills.values():
             # Connect skills that appear together
             for i, skill1 in enumerate(skills):
                 for skill2 in skills[i+1:]:
@@ -262,28 +274,24 @@ class SkillGraph:
                 if adv not in existing_skills:
                     skill_scores[adv] += 1.5 * weight
         
-        # Sort skills by score
-        sorted_skills = sorted(skill_scores.items(), key=lambda x: x[1], reverse=True)
+        # Select the top N skills by score without a full sort
+        top_skills = heapq.nlargest(top_n, skill_scores.items(), key=lambda x: x[1])
         
         # Return top N skills with scores
-        return [{'skill': skill, 'relevance': score} for skill, score in sorted_skills[:top_n]]
+        return [{'skill': skill, 'relevance': score} for skill, score in top_skills]
     
     def _convert_proficiency_to_weight(self, proficiency):
         """Convert proficiency level to numerical weight"""
-        proficiency = proficiency.lower()
-        if proficiency == "beginner":
-            return 0.25
-        elif proficiency == "intermediate":
-            return 0.5
-        elif proficiency == "advanced":
-            return 0.75
-        elif proficiency == "expert":
-            return 1.0
-        else:
+        level = PROFICIENCY_LEVELS.get(proficiency.lower())
+        if level is None:
             return 0.5  # Default to intermediate
+        return PROFICIENCY_WEIGHTS[level]
     
     def visualize_graph(self, output_path=None, skill_subset=None):
         """Visualize the skill graph"""
+        # Imported here so loading the graph does not pull in matplotlib
+        import matplotlib.pyplot as plt
+        
         if skill_subset:
             # Create a subgraph with just the specified skills
             subgraph = self.graph.subgraph(skill_subset)
@@ -410,8 +418,8 @@ class SkillGraph:
         # Add skill aliases to the graph
         self._add_skill_aliases_to_graph()
 
-# Example usage
-if __name__ == "__main__":
+def main():
+    """Build the skill graph from the course data, save it and draw the web skills."""
     base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     data_path = os.path.join(base_dir, 'data', 'course_skills.json')
     
@@ -428,4 +436,7 @@ if __name__ == "__main__":
     # Visualize a subset of the graph
     output_path = os.path.join(base_dir, 'data', 'skill_graph_visualization.png')
     web_skills = ['HTML', 'CSS', 'JavaScript', 'React', 'Angular', 'Web Design Principles']
-    skill_graph.visualize_graph(output_path, web_skills) 
\ No newline at end of file
+    skill_graph.visualize_graph(output_path, web_skills)
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,8 @@
-import json
 import os
+import heapq
 from collections import defaultdict
 from typing import Dict, List, Optional
+from .json_utils import load_json
 from .skill_hierarchy import SkillHierarchy
 
 class SkillMatcher:
@@ -21,10 +22,12 @@ class SkillMatcher:
         self.hierarchy = SkillHierarchy(hierarchy_path)
         
     def _load_course_data(self, course_data_path: str) -> Dict:
-        """Load course data from JSON file."""
+        """Load course data from JSON file, storing required skills as frozensets."""
         try:
-            with open(course_data_path, 'r') as f:
-                return json.load(f)
+            course_data = load_json(course_data_path)
+            for course_info in course_data.values():
+                course_info['required_skills'] = frozenset(course_info.get('required_skills', []))
+            return course_data
         except Exception as e:
             print(f"Error loading course data: {str(e)}")
             return {}
@@ -60,7 +63,7 @@ class SkillMatcher:
         user_skill_set = set(user_skills.keys())
         
         for course_name, course_info in self.course_data.items():
-            required_skills = set(course_info.get('required_skills', []))
+            required_skills = course_info['required_skills']
             
             if not required_skills:
                 continue
@@ -97,41 +100,47 @@ class SkillMatcher:
             # Calculate overall match percentage
             if match_scores:
                 match_percentage = (sum(match_scores) / len(required_skills)) * 100
-                
-                # Format matched skills with proficiency and certification info
-                formatted_matched_skills = []
-                for skill in matched_skills:
-                    skill_data = user_skills[skill]
-                    if isinstance(skill_data, dict):
-                        prof = skill_data.get('proficiency', 'Intermediate')
-                        is_cert = skill_data.get('isBackedByCertificate', False)
-                        cert_text = " (certified)" if is_cert else ""
-                        formatted_matched_skills.append(f"{skill} ({prof}{cert_text})")
-                    else:
-                        formatted_matched_skills.append(f"{skill} ({skill_data})")
-                
-                course_matches.append({
-                    'course_name': course_name,
-                    'match_percentage': match_percentage,
-                    'matched_skills': formatted_matched_skills,
-                    'missing_skills': missing_skills,
-                    'skill_match_details': {
-                        'match_scores': match_scores,
-                        'difficulty_level': max(self.hierarchy.get_skill_difficulty(skill) 
-                                             for skill in required_skills)
-                    }
-                })
-        
-        # Sort by match percentage and return top matches
-        course_matches.sort(key=lambda x: x['match_percentage'], reverse=True)
-        return course_matches[:limit]
+                course_matches.append((course_name, match_percentage, matched_skills,
+                                       missing_skills, match_scores, required_skills))
+        
+        # Select the top matches by match percentage without a full sort
+        course_matches = heapq.nlargest(limit, course_matches, key=lambda x: x[1])
+        
+        # Build the detailed entries for the returned courses only
+        recommendations = []
+        for course_name, match_percentage, matched_skills, missing_skills, match_scores, required_skills in course_matches:
+            # Format matched skills with proficiency and certification info
+            formatted_matched_skills = []
+            for skill in matched_skills:
+                skill_data = user_skills[skill]
+                if isinstance(skill_data, dict):
+                    prof = skill_data.get('proficiency', 'Intermediate')
+                    is_cert = skill_data.get('isBackedByCertificate', False)
+                    cert_text = " (certified)" if is_cert else ""
+                    formatted_matched_skills.append(f"{skill} ({prof}{cert_text})")
+                else:
+                    formatted_matched_skills.append(f"{skill} ({skill_data})")
+            
+            recommendations.append({
+                'course_name': course_name,
+                'match_percentage': match_percentage,
+                'matched_skills': formatted_matched_skills,
+                'missing_skills': missing_skills,
+                'skill_match_details': {
+                    'match_scores': match_scores,
+                    'difficulty_level': max(self.hierarchy.get_skill_difficulty(skill) 
+                                         for skill in required_skills)
+                }
+            })
+        
+        return recommendations
     
     def find_similar_courses(self, course_name: str, top_n: int = 5) -> List[Dict]:
         """Find courses similar to a given course using enhanced skill relationships."""
         if course_name not in self.course_data:
             return []
         
-        target_course_skills = set(self.course_data[course_name].get('required_skills', []))
+        target_course_skills = self.course_data[course_name]['required_skills']
         
         if not target_course_skills:
             return []
@@ -141,7 +150,7 @@ class SkillMatcher:
             if other_course == course_name:
                 continue
             
-            other_course_skills = set(course_info.get('required_skills', []))
+            other_course_skills = course_info['required_skills']
             
             if not other_course_skills:
                 continue
@@ -158,15 +167,17 @@ class SkillMatcher:
             
             if comparisons > 0:
                 similarity_score = (total_score / comparisons) * 100
-                similar_courses.append({
-                    'course_name': other_course,
-                    'similarity_score': similarity_score,
-                    'common_skills': list(target_course_skills & other_course_skills),
-                    'related_skills': list(target_course_skills ^ other_course_skills)
-                })
-        
-        similar_courses.sort(key=lambda x: x['similarity_score'], reverse=True)
-        return similar_courses[:top_n]
+                similar_courses.append((other_course, similarity_score, other_course_skills))
+        
+        similar_courses = heapq.nlargest(top_n, similar_courses, key=lambda x: x[1])
+        
+        # Only work out shared and differing skills for the returned courses
+        return [{
+            'course_name': other_course,
+            'similarity_score': similarity_score,
+            'common_skills': list(target_course_skills & other_course_skills),
+            'related_skills': list(target_course_skills ^ other_course_skills)
+        } for other_course, similarity_score, other_course_skills in similar_courses]
     
     def format_recommendations(self, recommendations):
         """
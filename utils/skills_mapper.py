@@ -1,11 +1,9 @@
 import json
-import os
+import heapq
 import numpy as np
 from collections import defaultdict
-import sys
 
-# Add parent directory to path to import from sibling modules if needed
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from .json_utils import load_json
 
 class SkillsMapper:
     """
@@ -22,6 +20,10 @@ class SkillsMapper:
         """
         self.threshold = threshold
         self.skill_embeddings = {}
+        self.skill_name_index = {}
+        self.embedding_names = []
+        self.embedding_index = {}
+        self.normalized_embeddings = None
         self.load_skill_embeddings(skill_embeddings_file)
         
     def load_skill_embeddings(self, filename):
@@ -32,12 +34,29 @@ class SkillsMapper:
             filename (str): Path to the embeddings file
         """
         try:
-            with open(filename, 'r') as f:
-                self.skill_embeddings = json.load(f)
+            self.skill_embeddings = load_json(filename)
             print(f"Loaded {len(self.skill_embeddings)} skill embeddings")
         except FileNotFoundError:
             print(f"Warning: Skill embeddings file {filename} not found")
             self.skill_embeddings = {}
+        
+        # Map lowercase names to embedding keys for case-insensitive lookups
+        self.skill_name_index = {}
+        for s in self.skill_embeddings:
+            self.skill_name_index.setdefault(s.lower(), s)
+            
+        # Stack all embeddings into one matrix of unit rows, so cosine
+        # similarity against every skill is a single matrix-vector product
+        self.embedding_names = list(self.skill_embeddings.keys())
+        self.embedding_index = {s: i for i, s in enumerate(self.embedding_names)}
+        if self.embedding_names:
+            embedding_matrix = np.array(list(self.skill_embeddings.values()), dtype=float)
+            norms = np.linalg.norm(embedding_matrix, axis=1, keepdims=True)
+            norms[norms == 0] = 1  # Zero vectors stay zero and score 0 against everything
+            # float32 halves the memory the similarity product streams through
+            self.normalized_embeddings = np.ascontiguousarray(embedding_matrix / norms, dtype=np.float32)
+        else:
+            self.normalized_embeddings = None
             
     def cosine_similarity(self, vec1, vec2):
         """
@@ -50,19 +69,22 @@ class SkillsMapper:
         Returns:
             float: Cosine similarity between the vectors
         """
-        vec1 = np.array(vec1)
-        vec2 = np.array(vec2)
+        vec1, norm1 = self._vector_with_norm(vec1)
+        vec2, norm2 = self._vector_with_norm(vec2)
         
-        # Handle zero vectors
-        if np.all(vec1 == 0) or np.all(vec2 == 0):
-            return 0.0
-            
-        # Calculate cosine similarity
-        dot_product = np.dot(vec1, vec2)
-        norm1 = np.linalg.norm(vec1)
-        norm2 = np.linalg.norm(vec2)
+        # Zero vectors have zero norm and score 0
+        return self._cosine_with_norms(vec1, norm1, vec2, norm2)
+        
+    def _vector_with_norm(self, embedding):
+        """Convert an embedding to an array and compute its L2 norm once for reuse."""
+        vector = np.array(embedding, dtype=float)
+        return vector, np.linalg.norm(vector)
         
-        return dot_product / (norm1 * norm2)
+    def _cosine_with_norms(self, vec1, norm1, vec2, norm2):
+        """Cosine similarity of two arrays whose norms are already known."""
+        if norm1 == 0 or norm2 == 0:
+            return 0.0
+        return float(np.dot(vec1, vec2)) / (norm1 * norm2)
         
     def find_similar_skills(self, skill, max_similar=3):
         """
@@ -79,25 +101,24 @@ class SkillsMapper:
             return []
             
         # Get embedding for the skill
-        skill_embedding = None
-        for s, embedding in self.skill_embeddings.items():
-            if s.lower() == skill.lower():
-                skill_embedding = embedding
-                break
+        skill_lower = skill.lower()
+        skill_key = self.skill_name_index.get(skill_lower)
+        skill_embedding = self.skill_embeddings[skill_key] if skill_key is not None else None
                 
         if not skill_embedding:
             return []
             
-        # Calculate similarities with all other skills
-        similarities = []
-        for s, embedding in self.skill_embeddings.items():
-            if s.lower() != skill.lower():
-                similarity = self.cosine_similarity(skill_embedding, embedding)
-                similarities.append((s, similarity))
+        # Calculate similarities with all skills as one dot product of unit vectors
+        scores = self.normalized_embeddings @ self.normalized_embeddings[self.embedding_index[skill_key]]
+            
+        similarities = [
+            (s, similarity)
+            for s, similarity in zip(self.embedding_names, scores.tolist())
+            if s.lower() != skill_lower
+        ]
                 
-        # Sort by similarity and get top matches
-        similarities.sort(key=lambda x: x[1], reverse=True)
-        return [s for s, _ in similarities[:max_similar]]
+        # Select the top matches by similarity without a full sort
+        return [s for s, _ in heapq.nlargest(max_similar, similarities, key=lambda x: x[1])]
         
     def map_skills(self, user_skills, course_skills):
         """
@@ -124,6 +145,14 @@ class SkillsMapper:
             
             return dict(skill_mapping)
         
+        # Convert each course skill embedding to an array with its norm once,
+        # instead of once per user skill
+        course_vectors = {}
+        for course_skill in course_skills:
+            course_embedding = self.skill_embeddings.get(course_skill.lower(), None)
+            if course_embedding:
+                course_vectors[course_skill] = self._vector_with_norm(course_embedding)
+        
         # For each user skill, find similar course skills
         for user_skill in user_skills:
             user_embedding = self.skill_embeddings.get(user_skill.lower(), None)
@@ -135,18 +164,20 @@ class SkillsMapper:
                         skill_mapping[user_skill].append((course_skill, 1.0))
                 continue
                 
+            user_vector, user_norm = self._vector_with_norm(user_embedding)
+                
             # Calculate similarity with each course skill
             for course_skill in course_skills:
-                course_embedding = self.skill_embeddings.get(course_skill.lower(), None)
+                course_vector = course_vectors.get(course_skill)
                 
-                if not course_embedding:
+                if course_vector is None:
                     # If no embedding for course skill, check exact match
                     if user_skill.lower() == course_skill.lower():
                         skill_mapping[user_skill].append((course_skill, 1.0))
                     continue
                     
                 # Calculate similarity
-                similarity = self.cosine_similarity(user_embedding, course_embedding)
+                similarity = self._cosine_with_norms(user_vector, user_norm, *course_vector)
                 
                 # If similarity exceeds threshold, add to mapping
                 if similarity >= self.threshold:
@@ -185,6 +216,13 @@ class SkillsMapper:
         if not self.skill_embeddings or len(skills) == 0:
             return [[skill] for skill in skills]
             
+        # Convert each skill's embedding to an array with its norm once
+        skill_vectors = {}
+        for skill in skills:
+            embedding = self.skill_embeddings.get(skill.lower(), None)
+            if embedding:
+                skill_vectors[skill] = self._vector_with_norm(embedding)
+        
         # Initialize groups with the first skill
         groups = []
         processed_skills = set()
@@ -198,8 +236,8 @@ class SkillsMapper:
             processed_skills.add(skill)
             
             # Get embedding for this skill
-            skill_embedding = self.skill_embeddings.get(skill.lower(), None)
-            if not skill_embedding:
+            skill_vector = skill_vectors.get(skill)
+            if skill_vector is None:
                 groups.append(current_group)
                 continue
                 
@@ -208,12 +246,12 @@ class SkillsMapper:
                 if other_skill in processed_skills:
                     continue
                     
-                other_embedding = self.skill_embeddings.get(other_skill.lower(), None)
-                if not other_embedding:
+                other_vector = skill_vectors.get(other_skill)
+                if other_vector is None:
                     continue
                     
                 # Calculate similarity
-                similarity = self.cosine_similarity(skill_embedding, other_embedding)
+                similarity = self._cosine_with_norms(*skill_vector, *other_vector)
                 
                 # If similar enough, add to current group
                 if similarity >= similarity_threshold:
@@ -1,9 +1,9 @@
 import os
 import re
+import csv
 import json
 import requests
 from bs4 import BeautifulSoup
-import pandas as pd
 from tqdm import tqdm
 
 class SyllabusScraper:
@@ -82,7 +82,7 @@ class SyllabusScraper:
             if course_code and course_name:
                 self.course_data[course_code] = {
                     "name": course_name,
-                    "required_skills": list(set(skills))  # Remove duplicates
+                    "required_skills": list(dict.fromkeys(skills))  # Remove duplicates, keeping order
                 }
                 return True
             
@@ -140,21 +140,26 @@ class SyllabusScraper:
         If skills_col is not provided, will attempt to extract skills from course descriptions.
         """
         try:
-            df = pd.read_csv(csv_path)
+            # Read rows as plain dicts; no DataFrame is needed for one pass.
+            # Empty cells are read as "", so rows without a course code or name are skipped
+            with open(csv_path, newline='', encoding='utf-8-sig') as f:
+                reader = csv.DictReader(f)
+                columns = reader.fieldnames or []
+                rows = list(reader)
             
-            for _, row in tqdm(df.iterrows(), total=len(df), desc="Processing CSV data"):
+            for row in tqdm(rows, total=len(rows), desc="Processing CSV data"):
                 course_code = str(row[course_code_col]).strip()
                 course_name = str(row[course_name_col]).strip()
                 
                 if course_code and course_name:
                     skills = []
-                    if skills_col and skills_col in df.columns:
+                    if skills_col and skills_col in columns:
                         skills_text = str(row[skills_col])
                         # Process skills text - could be comma-separated or similar
                         skills = [s.strip() for s in skills_text.split(',') if s.strip()]
                     
                     # If no skills column or empty skills, try to extract from description
-                    if not skills and 'description' in df.columns:
+                    if not skills and 'description' in columns:
                         skills = self._extract_skills_from_text(str(row['description']))
                     
                     self.course_data[course_code] = {
@@ -279,10 +284,13 @@ class SyllabusScraper:
                     if course_code not in self.course_data:
                         self.course_data[course_code] = course_info
                     else:
-                        # If course exists in both, merge skills
-                        existing_skills = set(self.course_data[course_code]["required_skills"])
-                        new_skills = set(course_info["required_skills"])
-                        self.course_data[course_code]["required_skills"] = list(existing_skills.union(new_skills))
+                        # If course exists in both, append only the skills not already present
+                        required_skills = self.course_data[course_code]["required_skills"]
+                        existing_skills = set(required_skills)
+                        for skill in course_info["required_skills"]:
+                            if skill not in existing_skills:
+                                existing_skills.add(skill)
+                                required_skills.append(skill)
                 
                 print(f"Successfully merged with existing data from {existing_json_path}")
                 return True
@@ -7,16 +7,18 @@ import base64
 from io import BytesIO
 from collections import defaultdict
 
+# Chart value of each proficiency level
+PROFICIENCY_VALUES = {
+    "beginner": 25,
+    "intermediate": 50,
+    "advanced": 75,
+    "expert": 100
+}
+
 def _convert_proficiency_to_value(proficiency):
     """Convert proficiency string to numerical value"""
     proficiency = proficiency.lower() if isinstance(proficiency, str) else "beginner"
-    proficiency_values = {
-        "beginner": 25,
-        "intermediate": 50,
-        "advanced": 75,
-        "expert": 100
-    }
-    return proficiency_values.get(proficiency, 25)
+    return PROFICIENCY_VALUES.get(proficiency, 25)
 
 def _extract_proficiency(skill_string):
     """Extract the proficiency level from a skill string like 'Python (Advanced)'"""
@@ -25,8 +27,7 @@ def _extract_proficiency(skill_string):
         
     if "(" in skill_string and ")" in skill_string:
         proficiency = skill_string.split("(")[1].split(")")[0].lower()
-        proficiency_values = ["beginner", "intermediate", "advanced", "expert"]
-        if proficiency in proficiency_values:
+        if proficiency in PROFICIENCY_VALUES:
             return proficiency
     return "beginner"
 